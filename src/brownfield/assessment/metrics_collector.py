@@ -309,6 +309,7 @@ class MetricsCollector:
         violations = []
 
         try:
+            import io
             import xml.etree.ElementTree as ET
 
             # Run lizard with XML output
@@ -321,41 +322,23 @@ class MetricsCollector:
             if result.returncode != 0 and not result.stdout:
                 return violations
 
-            # Parse lizard XML output
-            root = ET.fromstring(result.stdout)
+            # Stream-parse lizard XML output, clearing each <item> once handled
+            # so memory stays flat regardless of the number of functions
+            in_function_measure = False
+            for event, elem in ET.iterparse(io.StringIO(result.stdout), events=("start", "end")):
+                if elem.tag == "measure":
+                    in_function_measure = event == "start" and elem.get("type") == "Function"
+                    if event == "end":
+                        elem.clear()
+                    continue
 
-            # Find all function measurements
-            for item in root.findall(".//measure[@type='Function']/item"):
-                # Skip averages or summaries
-                if "average" in item.get("name", "").lower():
+                if event != "end" or elem.tag != "item" or not in_function_measure:
                     continue
 
-                # Get all value elements: Nr, NCSS, CCN
-                values = item.findall("value")
-                if len(values) >= 3:
-                    try:
-                        ccn = int(values[2].text)  # CCN is the 3rd value
-                        if ccn > threshold:
-                            # Extract details from item name
-                            # Format: "function_name(...) at ./path/to/file.py:line"
-                            item_name = item.get("name", "")
-                            if " at " in item_name:
-                                func_name = item_name.split(" at ")[0]
-                                location = item_name.split(" at ")[1]
-                                parts = location.split(":")
-                                file_path = parts[0].lstrip("./")
-                                line_num = int(parts[1]) if len(parts) > 1 else 0
-
-                                violations.append(
-                                    ComplexityViolation(
-                                        file=file_path,
-                                        function=func_name,
-                                        complexity=ccn,
-                                        line=line_num,
-                                    )
-                                )
-                    except (ValueError, AttributeError):
-                        continue
+                violation = self._parse_violation_item(elem, threshold)
+                if violation:
+                    violations.append(violation)
+                elem.clear()
 
         except Exception:
             pass
@@ -363,3 +346,46 @@ class MetricsCollector:
         # Sort by complexity (highest first)
         violations.sort(key=lambda v: v.complexity, reverse=True)
         return violations
+
+    @staticmethod
+    def _parse_violation_item(item, threshold: int) -> ComplexityViolation | None:
+        """
+        Build a ComplexityViolation from a lizard XML function <item>.
+
+        Args:
+            item: <item> element with Nr, NCSS and CCN <value> children
+            threshold: Complexity threshold
+
+        Returns:
+            ComplexityViolation if the function exceeds threshold, None otherwise
+        """
+        # Skip averages or summaries
+        item_name = item.get("name", "")
+        if "average" in item_name.lower():
+            return None
+
+        # Get all value elements: Nr, NCSS, CCN
+        values = item.findall("value")
+        if len(values) < 3:
+            return None
+
+        try:
+            ccn = int(values[2].text)  # CCN is the 3rd value
+            # Extract details from item name
+            # Format: "function_name(...) at ./path/to/file.py:line"
+            if ccn <= threshold or " at " not in item_name:
+                return None
+
+            func_name, location = item_name.split(" at ", 1)
+            parts = location.split(":")
+            file_path = parts[0].lstrip("./")
+            line_num = int(parts[1]) if len(parts) > 1 else 0
+        except (ValueError, AttributeError, TypeError):
+            return None
+
+        return ComplexityViolation(
+            file=file_path,
+            function=func_name,
+            complexity=ccn,
+            line=line_num,
+        )
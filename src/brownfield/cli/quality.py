@@ -111,6 +111,10 @@ def quality(
             result = handler.install_quality_gates(project_root, complexity_threshold)
             progress.update(task4, completed=1)
 
+        # Scan once configuration files are written, so results are cached under the final tree.
+        # Complexity is reported from the handler result, so only the security scan runs here.
+        security_issues = installer.scan_security_issues()
+
         # Display results
         console.print("\n[bold]Quality Analysis Results:[/bold]")
 
@@ -149,8 +153,6 @@ def quality(
 
         # Security scan
         console.print("\n[bold]Security Scan:[/bold]")
-        security_issues = installer.scan_security_issues()
-
         total_issues = sum(len(issues) for issues in security_issues.values())
 
         if total_issues > 0:
@@ -30,7 +30,12 @@ from brownfield.state.state_store import StateStore
     type=click.Path(),
     help="Output validation report to file",
 )
-def validate(gate: str, fail_fast: bool, report: str):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-run build, complexity and security checks even if sources are unchanged",
+)
+def validate(gate: str, fail_fast: bool, report: str, no_cache: bool):
     """
     Check all 7 readiness gates to determine graduation eligibility.
 
@@ -67,6 +72,7 @@ def validate(gate: str, fail_fast: bool, report: str):
         project_root=project_root,
         handler=handler,
         baseline_metrics=state.baseline_metrics,
+        use_cache=not no_cache,
     )
 
     # Run validation
@@ -79,3 +79,74 @@ class PhaseCheckpoint:
         # Consider interrupted if last checkpoint > 5 minutes ago and incomplete
         time_since_checkpoint = datetime.utcnow() - self.timestamp
         return time_since_checkpoint.total_seconds() > 300 and len(self.pending_tasks) > 0
+
+    def to_dict(self) -> dict:
+        """Convert checkpoint to dictionary for JSON serialization."""
+        return {
+            "phase": self.phase.value,
+            "completed_tasks": [
+                {
+                    "id": t.task_id,
+                    "description": t.description,
+                    "phase": t.phase.value,
+                    "estimated_minutes": t.estimated_minutes,
+                    "completed": t.completed,
+                    "status": t.status,
+                    "error_message": t.error_message,
+                    "git_commit_sha": t.git_commit_sha,
+                }
+                for t in self.completed_tasks
+            ],
+            "pending_tasks": [
+                {
+                    "id": t.task_id,
+                    "description": t.description,
+                    "phase": t.phase.value,
+                    "estimated_minutes": t.estimated_minutes,
+                    "completed": t.completed,
+                    "status": t.status,
+                    "error_message": t.error_message,
+                    "git_commit_sha": t.git_commit_sha,
+                }
+                for t in self.pending_tasks
+            ],
+            "timestamp": self.timestamp.isoformat(),
+            "interrupted": self.interrupted,
+            "context": self.context,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhaseCheckpoint":
+        """Convert dictionary from to_dict() back to a PhaseCheckpoint."""
+        return cls(
+            phase=Phase(data["phase"]),
+            completed_tasks=[
+                Task(
+                    task_id=t["id"],
+                    description=t["description"],
+                    phase=Phase(t["phase"]),
+                    estimated_minutes=t["estimated_minutes"],
+                    completed=t.get("completed", True),
+                    status=t.get("status", "completed"),
+                    error_message=t.get("error_message"),
+                    git_commit_sha=t.get("git_commit_sha"),
+                )
+                for t in data["completed_tasks"]
+            ],
+            pending_tasks=[
+                Task(
+                    task_id=t["id"],
+                    description=t["description"],
+                    phase=Phase(t["phase"]),
+                    estimated_minutes=t["estimated_minutes"],
+                    completed=t.get("completed", False),
+                    status=t.get("status", "pending"),
+                    error_message=t.get("error_message"),
+                    git_commit_sha=t.get("git_commit_sha"),
+                )
+                for t in data["pending_tasks"]
+            ],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            interrupted=data["interrupted"],
+            context=data.get("context", {}),
+        )
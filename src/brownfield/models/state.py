@@ -8,6 +8,8 @@ from pathlib import Path
 
 from brownfield.models.assessment import Metrics
 from brownfield.models.workflow import PhaseExecution, PhaseStatus, WorkflowPhase, WorkflowState
+from brownfield.utils import fast_json
+from brownfield.utils.file_operations import FileOperations
 
 
 class Phase(Enum):
@@ -130,6 +132,10 @@ class BrownfieldState:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
+        return json.dumps(self._to_serializable(), indent=2)
+
+    def _to_serializable(self) -> dict:
+        """Convert to a dict of JSON-compatible values."""
         data = asdict(self)
         # Convert Path objects to strings
         data["project_root"] = str(self.project_root) if self.project_root else None
@@ -178,7 +184,7 @@ class BrownfieldState:
         if speckit_data.get("last_monitor_check"):
             speckit_data["last_monitor_check"] = speckit_data["last_monitor_check"].isoformat()
 
-        return json.dumps(data, indent=2)
+        return data
 
     @classmethod
     def load(cls, path: Path) -> "BrownfieldState":
@@ -186,8 +192,7 @@ class BrownfieldState:
         if not path.exists():
             raise FileNotFoundError(f"State file not found: {path}")
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = fast_json.load_file(path)
 
         # Convert strings back to appropriate types
         if data.get("project_root"):
@@ -283,5 +288,4 @@ class BrownfieldState:
     def save(self, path: Path) -> None:
         """Save state to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.to_json())
+        FileOperations.atomic_write_bytes(path, fast_json.dumps(self._to_serializable(), indent=True))
@@ -47,7 +47,7 @@ class CheckpointManager:
 
         checkpoint_path = self.checkpoint_dir / f"{phase.value}-checkpoint.json"
         checkpoint_path.write_text(
-            json.dumps(self._checkpoint_to_dict(checkpoint), indent=2),
+            json.dumps(checkpoint.to_dict(), indent=2),
             encoding="utf-8",
         )
 
@@ -71,7 +71,7 @@ class CheckpointManager:
         with open(checkpoint_path, encoding="utf-8") as f:
             data = json.load(f)
 
-        return self._dict_to_checkpoint(data)
+        return PhaseCheckpoint.from_dict(data)
 
     def mark_interrupted(self, phase: Phase) -> None:
         """
@@ -165,73 +165,3 @@ class CheckpointManager:
             )
 
         return sorted(checkpoints, key=lambda x: x["timestamp"], reverse=True)
-
-    def _checkpoint_to_dict(self, checkpoint: PhaseCheckpoint) -> dict:
-        """Convert checkpoint to dictionary for JSON serialization."""
-        return {
-            "phase": checkpoint.phase.value,
-            "completed_tasks": [
-                {
-                    "id": t.task_id,
-                    "description": t.description,
-                    "phase": t.phase.value,
-                    "estimated_minutes": t.estimated_minutes,
-                    "completed": t.completed,
-                    "status": t.status,
-                    "error_message": t.error_message,
-                    "git_commit_sha": t.git_commit_sha,
-                }
-                for t in checkpoint.completed_tasks
-            ],
-            "pending_tasks": [
-                {
-                    "id": t.task_id,
-                    "description": t.description,
-                    "phase": t.phase.value,
-                    "estimated_minutes": t.estimated_minutes,
-                    "completed": t.completed,
-                    "status": t.status,
-                    "error_message": t.error_message,
-                    "git_commit_sha": t.git_commit_sha,
-                }
-                for t in checkpoint.pending_tasks
-            ],
-            "timestamp": checkpoint.timestamp.isoformat(),
-            "interrupted": checkpoint.interrupted,
-            "context": checkpoint.context,
-        }
-
-    def _dict_to_checkpoint(self, data: dict) -> PhaseCheckpoint:
-        """Convert dictionary to PhaseCheckpoint."""
-        return PhaseCheckpoint(
-            phase=Phase(data["phase"]),
-            completed_tasks=[
-                Task(
-                    task_id=t["id"],
-                    description=t["description"],
-                    phase=Phase(t["phase"]),
-                    estimated_minutes=t["estimated_minutes"],
-                    completed=t.get("completed", True),
-                    status=t.get("status", "completed"),
-                    error_message=t.get("error_message"),
-                    git_commit_sha=t.get("git_commit_sha"),
-                )
-                for t in data["completed_tasks"]
-            ],
-            pending_tasks=[
-                Task(
-                    task_id=t["id"],
-                    description=t["description"],
-                    phase=Phase(t["phase"]),
-                    estimated_minutes=t["estimated_minutes"],
-                    completed=t.get("completed", False),
-                    status=t.get("status", "pending"),
-                    error_message=t.get("error_message"),
-                    git_commit_sha=t.get("git_commit_sha"),
-                )
-                for t in data["pending_tasks"]
-            ],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            interrupted=data["interrupted"],
-            context=data.get("context", {}),
-        )
@@ -1,6 +1,7 @@
 """Utilities for loading and saving unified remediation plans."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from brownfield.config import BrownfieldConfig
@@ -13,6 +14,17 @@ from brownfield.models.orchestrator import (
 )
 
 
+@lru_cache(maxsize=1024)
+def _intern_path(path_str: str) -> Path:
+    """
+    Return a shared Path instance for a serialized path string.
+
+    Path objects are immutable, so repeated plan loads in the same process
+    can reuse them instead of allocating a new Path per entry.
+    """
+    return Path(path_str)
+
+
 def save_unified_plan(plan: UnifiedPlan, project_root: Path | None = None) -> Path:
     """
     Save unified plan to .specify/memory/unified-plan.json.
@@ -105,7 +117,7 @@ def load_unified_plan(project_root: Path | None = None) -> UnifiedPlan:
     # Reconstruct TestingPlan
     tp_data = plan_data["testing_plan"]
     testing_plan = TestingPlan(
-        core_modules=[Path(m) for m in tp_data["core_modules"]],
+        core_modules=[_intern_path(m) for m in tp_data["core_modules"]],
         smoke_tests_needed=tp_data["smoke_tests_needed"],
         contract_tests_needed=tp_data["contract_tests_needed"],
         current_coverage=tp_data["current_coverage"],
@@ -130,6 +142,6 @@ def load_unified_plan(project_root: Path | None = None) -> UnifiedPlan:
         estimated_duration_hours=plan_data["estimated_duration_hours"],
         dependencies=plan_data["dependencies"],
         plan_markdown=plan_data["plan_markdown"],
-        plan_path=Path(plan_data["plan_path"]),
+        plan_path=_intern_path(plan_data["plan_path"]),
         total_tasks=plan_data["total_tasks"],
     )
@@ -1,10 +1,8 @@
-"""Plugin system for language-specific handlers."""
+"""Plugin system for language-specific handlers.
+
+Handler modules are imported lazily by the registry on first use.
+"""
 
-# Import handlers to trigger registration
-from brownfield.plugins import go_handler as _go_handler
-from brownfield.plugins import javascript_handler as _javascript_handler
-from brownfield.plugins import python_handler as _python_handler
-from brownfield.plugins import rust_handler as _rust_handler
 from brownfield.plugins.base import (
     DetectionResult,
     LanguageHandler,
@@ -14,9 +12,6 @@ from brownfield.plugins.base import (
 )
 from brownfield.plugins.registry import get_handler, list_supported_languages, register_handler
 
-# Keep references to prevent garbage collection
-_ = (_go_handler, _javascript_handler, _python_handler, _rust_handler)
-
 __all__ = [
     "DetectionResult",
     "LanguageHandler",
@@ -1,10 +1,17 @@
 """Base class for language-specific handlers."""
 
+import csv
+import io
+import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
 from brownfield.models.assessment import ConfidenceLevel
+from brownfield.utils.process_runner import ProcessRunner
+
+# Functions above this cyclomatic complexity count as violations
+COMPLEXITY_VIOLATION_THRESHOLD = 10
 
 
 @dataclass
@@ -142,3 +149,68 @@ class LanguageHandler(ABC):
         Returns:
             Dictionary with vulnerability counts by severity
         """
+
+    def _lizard_metrics(self, project_root: Path, lizard_language: str | None = None) -> dict[str, float]:
+        """
+        Run lizard and aggregate function complexity.
+
+        Shared implementation for handlers whose languages lizard supports.
+
+        Args:
+            project_root: Path to project directory
+            lizard_language: Restrict analysis to one lizard language (e.g. "javascript")
+
+        Returns:
+            Dictionary with average, maximum and violation count (all 0.0 if lizard is unavailable)
+        """
+        defaults = {"average": 0.0, "maximum": 0.0, "violations": 0.0}
+        cmd = ["lizard", str(project_root), "--csv"]
+        if lizard_language:
+            cmd.extend(["-l", lizard_language])
+
+        try:
+            # CSV output is one row per function, streamed as lizard goes
+            result = ProcessRunner.run(
+                cmd,
+                cwd=str(project_root),
+                timeout=300,  # 5 minute timeout
+                idle_timeout=60,  # lizard streams CSV rows, so silence means it is stuck
+            )
+
+            if result.returncode != 0 and not result.stdout:
+                # Lizard failed completely, return safe defaults
+                return defaults
+
+            # Columns: NLOC, CCN, token, PARAM, length, location, file, function, long_name, start, end
+            # Aggregate in a single pass - no per-function list is kept
+            count = 0
+            total = 0
+            maximum = 0
+            violations = 0
+
+            for row in csv.reader(io.StringIO(result.stdout)):
+                if len(row) < 2:
+                    continue
+                try:
+                    ccn = int(row[1])  # CCN is the 2nd column
+                except ValueError:
+                    continue  # Header row (lizard --verbose) or malformed line
+                count += 1
+                total += ccn
+                if ccn > maximum:
+                    maximum = ccn
+                if ccn > COMPLEXITY_VIOLATION_THRESHOLD:
+                    violations += 1
+
+        except (OSError, csv.Error, ValueError, subprocess.TimeoutExpired):
+            # Tool not available, failed or stalled
+            return defaults
+
+        if not count:
+            return defaults
+
+        return {
+            "average": total / count,
+            "maximum": float(maximum),
+            "violations": float(violations),
+        }
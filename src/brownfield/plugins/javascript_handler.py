@@ -10,6 +10,9 @@ from brownfield.plugins.base import (
     TestSetupResult,
 )
 from brownfield.plugins.registry import register_handler
+from brownfield.utils import fast_json
+from brownfield.utils.cache import cache_result, source_tree_key
+from brownfield.utils.process_runner import ProcessRunner
 
 
 @register_handler("javascript")
@@ -41,76 +44,29 @@ class JavaScriptHandler(LanguageHandler):
     def verify_build(self, project_root: Path) -> bool:
         return True
 
+    @cache_result(key_func=source_tree_key("javascript:complexity"))
     def measure_complexity(self, project_root: Path) -> dict[str, float]:
         """Use lizard for complexity analysis on JavaScript files."""
-        import xml.etree.ElementTree as ET
-
-        from brownfield.orchestrator.process_runner import ProcessRunner
-
-        try:
-            # Run lizard with XML output for JavaScript files
-            result = ProcessRunner.run(
-                ["lizard", str(project_root), "--xml", "-l", "javascript"],
-                cwd=str(project_root),
-                timeout=300,  # 5 minute timeout
-            )
-
-            if result.returncode != 0 and not result.stdout:
-                # Lizard failed completely, return safe defaults
-                return {"average": 0.0, "maximum": 0.0, "violations": 0.0}
-
-            # Parse lizard XML output
-            root = ET.fromstring(result.stdout)
-
-            # Extract complexity metrics
-            complexities = []
-            violations = 0
-
-            for measure in root.findall(".//measure[@type='Function']"):
-                for item in measure.findall("item"):
-                    values = item.findall("value")
-                    if len(values) >= 3:
-                        try:
-                            ccn = int(values[2].text)  # CCN is the 3rd value
-                            complexities.append(ccn)
-                            if ccn > 10:
-                                violations += 1
-                        except (ValueError, AttributeError):
-                            continue
-
-            if not complexities:
-                return {"average": 0.0, "maximum": 0.0, "violations": 0.0}
-
-            return {
-                "average": sum(complexities) / len(complexities),
-                "maximum": float(max(complexities)),
-                "violations": float(violations),
-            }
-
-        except (ET.ParseError, ValueError):
-            # Tool not available or failed
-            return {"average": 0.0, "maximum": 0.0, "violations": 0.0}
+        return self._lizard_metrics(project_root, lizard_language="javascript")
 
+    @cache_result(key_func=source_tree_key("javascript:security"))
     def scan_security(self, project_root: Path) -> dict[str, int]:
         """Run npm audit security scanner."""
-        import json
-
-        from brownfield.orchestrator.process_runner import ProcessRunner
-
         try:
             # Run npm audit with JSON output
             result = ProcessRunner.run(
                 ["npm", "audit", "--json"],
                 cwd=str(project_root),
                 timeout=300,  # 5 minute timeout
+                text=False,  # Keep raw bytes - no decode before parsing
             )
 
             # npm audit returns non-zero when vulnerabilities found
             if not result.stdout:
                 return {"critical": 0, "high": 0, "medium": 0, "low": 0}
 
-            # Parse npm audit JSON output
-            data = json.loads(result.stdout)
+            # Parse npm audit JSON output straight from bytes
+            data = fast_json.loads(result.stdout)
 
             # Count vulnerabilities by severity
             severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
@@ -128,6 +84,6 @@ class JavaScriptHandler(LanguageHandler):
 
             return severity_counts
 
-        except (json.JSONDecodeError, ValueError, KeyError):
+        except (fast_json.JSONDecodeError, ValueError, KeyError):
             # Tool not available or failed
             return {"critical": 0, "high": 0, "medium": 0, "low": 0}
@@ -1,13 +1,32 @@
-"""Plugin registry for language handlers."""
+"""Plugin registry for language handlers.
+
+Handlers are discovered lazily: built-in handlers and any third-party handlers
+published under the ``brownfield.handlers`` entry point group are only
+imported when first requested via ``get_handler``.
+"""
+
+from importlib.metadata import EntryPoint, entry_points
 
 from brownfield.plugins.base import LanguageHandler
 
+ENTRY_POINT_GROUP = "brownfield.handlers"
+
+# Built-in handlers, resolvable even when the package metadata is not installed
+_BUILTIN_HANDLERS = {
+    "go": "brownfield.plugins.go_handler:GoHandler",
+    "javascript": "brownfield.plugins.javascript_handler:JavaScriptHandler",
+    "python": "brownfield.plugins.python_handler:PythonHandler",
+    "rust": "brownfield.plugins.rust_handler:RustHandler",
+}
+
 
 class UnsupportedLanguageError(Exception):
     """Raised when language handler not found."""
 
 
 _handlers: dict[str, type[LanguageHandler]] = {}
+_instances: dict[str, LanguageHandler] = {}
+_entry_points: dict[str, EntryPoint] = {}
 
 
 def register_handler(name: str):
@@ -22,15 +41,35 @@ def register_handler(name: str):
 
     def decorator(cls: type[LanguageHandler]) -> type[LanguageHandler]:
         _handlers[name] = cls
+        _instances.pop(name, None)  # Re-registration replaces any cached instance
         return cls
 
     return decorator
 
 
+def _discover() -> dict[str, EntryPoint]:
+    """
+    Collect handler entry points without importing them.
+
+    Returns:
+        Mapping of language name to entry point (built-ins first)
+    """
+    if not _entry_points:
+        for name, value in _BUILTIN_HANDLERS.items():
+            _entry_points[name] = EntryPoint(name=name, value=value, group=ENTRY_POINT_GROUP)
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            _entry_points.setdefault(entry_point.name, entry_point)
+
+    return _entry_points
+
+
 def get_handler(language: str) -> LanguageHandler:
     """
     Get registered handler for language.
 
+    Handlers are stateless, so one instance per language is created on first
+    use and shared by all later callers.
+
     Args:
         language: Language name (lowercase)
 
@@ -40,11 +79,20 @@ def get_handler(language: str) -> LanguageHandler:
     Raises:
         UnsupportedLanguageError: If language not registered
     """
-    if language not in _handlers:
-        raise UnsupportedLanguageError(f"No handler for {language}")
-    return _handlers[language]()
+    handler = _instances.get(language)
+    if handler is None:
+        if language not in _handlers:
+            entry_point = _discover().get(language)
+            if entry_point is None:
+                raise UnsupportedLanguageError(f"No handler for {language}")
+            # Importing a handler module registers it via @register_handler
+            _handlers.setdefault(language, entry_point.load())
+        handler = _instances[language] = _handlers[language]()
+    return handler
 
 
 def list_supported_languages() -> list[str]:
     """Return list of supported language names."""
-    return list(_handlers.keys())
+    languages = list(_discover())
+    languages.extend(name for name in _handlers if name not in languages)
+    return languages
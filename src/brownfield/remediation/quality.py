@@ -1,10 +1,133 @@
 """Quality gates installation and enforcement."""
 
+import io
 import subprocess
+import threading
+import tomllib
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO, Any
 
+from brownfield.config import BrownfieldConfig
 from brownfield.plugins.base import LanguageHandler, QualitySetupResult
 from brownfield.state.decision_logger import DecisionLogger
+from brownfield.utils import fast_json
+from brownfield.utils.cache import DiskCache, source_tree_fingerprint
+
+try:
+    import ijson
+except ImportError:  # optional dependency (pip install brownkit[fast])
+    ijson = None
+
+# Seconds before a hung analysis tool is killed
+SCAN_TIMEOUT_SECONDS = 300
+
+# Generated configuration files, encoded once at import time
+PRE_COMMIT_CONFIG_BYTES = b"""# Pre-commit hooks for code quality
+# See https://pre-commit.com for more information
+
+repos:
+  - repo: https://github.com/pre-commit/pre-commit-hooks
+    rev: v4.5.0
+    hooks:
+      - id: trailing-whitespace
+      - id: end-of-file-fixer
+      - id: check-yaml
+      - id: check-added-large-files
+        args: ['--maxkb=500']
+      - id: check-merge-conflict
+      - id: detect-private-key
+
+  - repo: https://github.com/psf/black
+    rev: 23.12.1
+    hooks:
+      - id: black
+        language_version: python3.11
+
+  - repo: https://github.com/PyCQA/pylint
+    rev: v3.0.3
+    hooks:
+      - id: pylint
+        args: ['--max-line-length=100', '--disable=C0111,R0903']
+
+  - repo: local
+    hooks:
+      - id: complexity-check
+        name: Check cyclomatic complexity
+        entry: bash -c 'lizard --CCN 10 .'
+        language: system
+        pass_filenames: false
+"""
+
+PYLINTRC_BYTES = b"""[MASTER]
+# Python code to execute, usually for sys.path manipulation
+init-hook='import sys; sys.path.append("src")'
+
+[MESSAGES CONTROL]
+# Disable specific warnings
+disable=C0111,  # missing-docstring
+        R0903,  # too-few-public-methods
+        W0212,  # protected-access
+        C0103   # invalid-name
+
+[FORMAT]
+# Maximum number of characters on a single line
+max-line-length=100
+
+# Maximum number of lines in a module
+max-module-lines=1000
+
+[BASIC]
+# Good variable names
+good-names=i,j,k,ex,e,f,db,id,_
+
+[DESIGN]
+# Maximum number of arguments for function / method
+max-args=7
+
+# Maximum number of locals for function / method body
+max-locals=15
+
+# Maximum number of return / yield for function / method body
+max-returns=6
+
+# Maximum number of branch for function / method body
+max-branches=12
+
+# Maximum number of statements in function / method body
+max-statements=50
+
+[SIMILARITIES]
+# Minimum lines number of a similarity
+min-similarity-lines=4
+
+[TYPECHECK]
+# List of module names for which member attributes should not be checked
+ignored-modules=
+"""
+
+BLACK_CONFIG_BYTES = b"""
+
+[tool.black]
+line-length = 100
+target-version = ['py311']
+include = '\\.pyi?$'
+extend-exclude = '''
+/(
+  # directories
+  \\.eggs
+  | \\.git
+  | \\.hg
+  | \\.mypy_cache
+  | \\.tox
+  | \\.venv
+  | build
+  | dist
+)/
+'''
+"""
 
 
 class QualityGatesInstaller:
@@ -21,6 +144,7 @@ class QualityGatesInstaller:
         self.handler = handler
         self.project_root = project_root
         self.decision_logger = DecisionLogger(project_root / ".specify" / "memory" / "brownfield-decisions.md")
+        self.scan_cache = DiskCache(BrownfieldConfig.get_state_dir(project_root) / "cache")
 
     def install(
         self,
@@ -73,62 +197,111 @@ class QualityGatesInstaller:
         Returns:
             Dictionary with complexity violations by file
         """
-        violations = {}
+        # Reuse results from a previous run on an unchanged tree
+        cache_key = source_tree_fingerprint(self.project_root, f"quality:complexity:{threshold}")
+        cached = self.scan_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        try:
-            # Run lizard with XML output
-            result = subprocess.run(
-                ["lizard", str(self.project_root), "--xml"],
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
+        violations = self._run_lizard(threshold)
+        if violations is None:
+            return {}
 
-            if result.returncode != 0 and not result.stdout:
-                return violations
-
-            # Parse XML to find violations
-            import xml.etree.ElementTree as ET
-
-            root = ET.fromstring(result.stdout)
-
-            for item in root.findall(".//measure[@type='Function']/item"):
-                if "average" in item.get("name", "").lower():
-                    continue
-
-                values = item.findall("value")
-                if len(values) >= 3:
-                    try:
-                        ccn = int(values[2].text)
-                        if ccn > threshold:
-                            # Extract file and function name from item name
-                            item_name = item.get("name", "")
-                            # Format: "function_name(...) at ./path/to/file.py:line"
-                            if " at " in item_name:
-                                func_name = item_name.split(" at ")[0]
-                                location = item_name.split(" at ")[1]
-
-                                file_path = location.split(":")[0].lstrip("./")
-
-                                if file_path not in violations:
-                                    violations[file_path] = []
-
-                                violations[file_path].append(
-                                    {
-                                        "function": func_name,
-                                        "complexity": ccn,
-                                        "threshold": threshold,
-                                        "location": location,
-                                    }
-                                )
-                    except (ValueError, AttributeError):
-                        continue
+        self.scan_cache.set(cache_key, violations)
+        return violations
 
+    def _run_lizard(self, threshold: int) -> dict[str, list[dict]] | None:
+        """Run lizard and collect violations by file, or None if it did not run."""
+        violations = {}
+
+        try:
+            for file_path, entry in self._iter_lizard_violations(threshold):
+                violations.setdefault(file_path, []).append(entry)
         except Exception:
-            pass
+            return None
 
         return violations
 
+    def _iter_lizard_violations(self, threshold: int) -> Iterator[tuple[str, dict]]:
+        """
+        Yield functions exceeding the complexity threshold from lizard's XML report.
+
+        Args:
+            threshold: Maximum allowed cyclomatic complexity
+
+        Yields:
+            (file path, violation details) for each violating function
+
+        Raises:
+            RuntimeError: If the lizard CLI fails without producing output
+        """
+        # Run lizard with XML output
+        result = subprocess.run(
+            ["lizard", str(self.project_root), "--xml"],
+            capture_output=True,
+            timeout=SCAN_TIMEOUT_SECONDS,
+        )
+
+        if result.returncode != 0 and not result.stdout:
+            raise RuntimeError("lizard produced no output")
+
+        # Stream the XML so only one <item> is held in memory at a time
+        in_function_measure = False
+        for event, elem in ET.iterparse(io.BytesIO(result.stdout), events=("start", "end")):
+            if elem.tag == "measure":
+                in_function_measure = event == "start" and elem.get("type") == "Function"
+                if event == "end":
+                    elem.clear()
+                continue
+
+            if event != "end" or elem.tag != "item" or not in_function_measure:
+                continue
+
+            violation = self._parse_complexity_item(elem, threshold)
+            elem.clear()
+            if violation:
+                yield violation
+
+    @staticmethod
+    def _parse_complexity_item(item, threshold: int) -> tuple[str, dict] | None:
+        """
+        Extract a complexity violation from a lizard XML function <item>.
+
+        Args:
+            item: <item> element with Nr, NCSS and CCN <value> children
+            threshold: Maximum allowed cyclomatic complexity
+
+        Returns:
+            (file path, violation details) if the function exceeds threshold, None otherwise
+        """
+        # Check CCN first: most functions pass, so skip name handling for them
+        values = item.findall("value")
+        if len(values) < 3:
+            return None
+
+        try:
+            ccn = int(values[2].text)
+        except (ValueError, TypeError):
+            return None
+
+        if ccn <= threshold:
+            return None
+
+        # Format: "function_name(...) at ./path/to/file.py:line"
+        item_name = item.get("name", "")
+        if "average" in item_name.lower() or " at " not in item_name:
+            return None
+
+        func_name, location = item_name.split(" at ")[:2]
+        file_path = location.split(":")[0].lstrip("./")
+
+        return file_path, {
+            "function": func_name,
+            "complexity": ccn,
+            "threshold": threshold,
+            "location": location,
+        }
+
     def scan_security_issues(self) -> dict[str, list[dict]]:
         """
         Scan for security issues using language-specific tools.
@@ -136,6 +309,21 @@ class QualityGatesInstaller:
         Returns:
             Dictionary with security issues by severity
         """
+        # Reuse results from a previous run on an unchanged tree
+        cache_key = source_tree_fingerprint(self.project_root, "quality:security")
+        cached = self.scan_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        issues_by_severity = self._run_bandit()
+        if issues_by_severity is None:
+            return {"critical": [], "high": [], "medium": [], "low": []}
+
+        self.scan_cache.set(cache_key, issues_by_severity)
+        return issues_by_severity
+
+    def _run_bandit(self) -> dict[str, list[dict]] | None:
+        """Run bandit and group its issues by severity, or None if it did not run."""
         issues_by_severity = {
             "critical": [],
             "high": [],
@@ -144,84 +332,92 @@ class QualityGatesInstaller:
         }
 
         try:
-            # For Python, get detailed bandit output
-            result = subprocess.run(
-                ["bandit", "-r", str(self.project_root), "-f", "json"],
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-
-            if result.stdout:
-                import json
+            for issue in self._iter_bandit_issues():
+                severity = issue.get("issue_severity", "").lower()
+                if severity in issues_by_severity:
+                    issues_by_severity[severity].append(
+                        {
+                            "file": issue.get("filename", ""),
+                            "line": issue.get("line_number", 0),
+                            "issue": issue.get("issue_text", ""),
+                            "confidence": issue.get("issue_confidence", ""),
+                            "severity": severity,
+                        }
+                    )
+        except Exception:
+            return None
 
-                data = json.loads(result.stdout)
+        return issues_by_severity
 
-                for issue in data.get("results", []):
-                    severity = issue.get("issue_severity", "").lower()
-                    if severity in issues_by_severity:
-                        issues_by_severity[severity].append(
-                            {
-                                "file": issue.get("filename", ""),
-                                "line": issue.get("line_number", 0),
-                                "issue": issue.get("issue_text", ""),
-                                "confidence": issue.get("issue_confidence", ""),
-                                "severity": severity,
-                            }
-                        )
+    def _iter_bandit_issues(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield bandit issues for the project, parsed as its JSON report is written.
 
-        except Exception:
-            pass
+        Yields:
+            Bandit issue dictionaries
+        """
+        process = subprocess.Popen(
+            ["bandit", "-r", str(self.project_root), "-f", "json"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        watchdog = threading.Timer(SCAN_TIMEOUT_SECONDS, process.kill)
+        watchdog.start()
 
-        return issues_by_severity
+        try:
+            yield from self._iter_bandit_results(process.stdout)
+        finally:
+            watchdog.cancel()
+            process.stdout.close()
+            process.wait()
 
-    def create_pre_commit_config(self) -> Path:
+    def run_all_scans(self, threshold: int = 10) -> tuple[dict[str, list[dict]], dict[str, list[dict]]]:
         """
-        Create .pre-commit-config.yaml for Python projects.
+        Run complexity analysis and security scan concurrently.
+
+        Args:
+            threshold: Maximum allowed cyclomatic complexity
 
         Returns:
-            Path to created config file
+            Tuple of (complexity violations by file, security issues by severity)
         """
-        config_path = self.project_root / ".pre-commit-config.yaml"
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            complexity_future = executor.submit(self.analyze_complexity, threshold)
+            security_future = executor.submit(self.scan_security_issues)
+            return complexity_future.result(), security_future.result()
 
-        # Python-specific pre-commit configuration
-        config_content = """# Pre-commit hooks for code quality
-# See https://pre-commit.com for more information
+    @staticmethod
+    def _iter_bandit_results(stream: IO[bytes]) -> Iterator[dict[str, Any]]:
+        """
+        Yield issues from a bandit JSON report stream.
 
-repos:
-  - repo: https://github.com/pre-commit/pre-commit-hooks
-    rev: v4.5.0
-    hooks:
-      - id: trailing-whitespace
-      - id: end-of-file-fixer
-      - id: check-yaml
-      - id: check-added-large-files
-        args: ['--maxkb=500']
-      - id: check-merge-conflict
-      - id: detect-private-key
+        With ijson installed, issues are parsed incrementally so memory stays
+        flat regardless of report size; otherwise the report is read whole.
 
-  - repo: https://github.com/psf/black
-    rev: 23.12.1
-    hooks:
-      - id: black
-        language_version: python3.11
+        Args:
+            stream: Binary stream of bandit's JSON output
 
-  - repo: https://github.com/PyCQA/pylint
-    rev: v3.0.3
-    hooks:
-      - id: pylint
-        args: ['--max-line-length=100', '--disable=C0111,R0903']
+        Yields:
+            Bandit issue dictionaries from the report's "results" array
+        """
+        if ijson is not None:
+            yield from ijson.items(stream, "results.item")
+            return
 
-  - repo: local
-    hooks:
-      - id: complexity-check
-        name: Check cyclomatic complexity
-        entry: bash -c 'lizard --CCN 10 .'
-        language: system
-        pass_filenames: false
-"""
+        report = stream.read()
+        if report:
+            yield from fast_json.loads(report).get("results", [])
+
+    def create_pre_commit_config(self) -> Path:
+        """
+        Create .pre-commit-config.yaml for Python projects.
+
+        Returns:
+            Path to created config file
+        """
+        config_path = self.project_root / ".pre-commit-config.yaml"
 
-        config_path.write_text(config_content, encoding="utf-8")
+        config_path.write_bytes(PRE_COMMIT_CONFIG_BYTES)
         return config_path
 
     def install_pre_commit_hooks(self) -> list[str]:
@@ -250,6 +446,18 @@ repos:
             if result.returncode == 0:
                 hooks_installed.append("pre-commit-framework")
 
+                # Build hook environments now rather than on the first commit
+                result = subprocess.run(
+                    ["pre-commit", "install-hooks"],
+                    cwd=self.project_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=600,
+                )
+
+                if result.returncode == 0:
+                    hooks_installed.append("pre-commit-environments")
+
         except (subprocess.SubprocessError, FileNotFoundError):
             # pre-commit not installed, that's okay - config file is still created
             pass
@@ -269,54 +477,7 @@ repos:
         if config_path.exists():
             return config_path
 
-        config_content = """[MASTER]
-# Python code to execute, usually for sys.path manipulation
-init-hook='import sys; sys.path.append("src")'
-
-[MESSAGES CONTROL]
-# Disable specific warnings
-disable=C0111,  # missing-docstring
-        R0903,  # too-few-public-methods
-        W0212,  # protected-access
-        C0103   # invalid-name
-
-[FORMAT]
-# Maximum number of characters on a single line
-max-line-length=100
-
-# Maximum number of lines in a module
-max-module-lines=1000
-
-[BASIC]
-# Good variable names
-good-names=i,j,k,ex,e,f,db,id,_
-
-[DESIGN]
-# Maximum number of arguments for function / method
-max-args=7
-
-# Maximum number of locals for function / method body
-max-locals=15
-
-# Maximum number of return / yield for function / method body
-max-returns=6
-
-# Maximum number of branch for function / method body
-max-branches=12
-
-# Maximum number of statements in function / method body
-max-statements=50
-
-[SIMILARITIES]
-# Minimum lines number of a similarity
-min-similarity-lines=4
-
-[TYPECHECK]
-# List of module names for which member attributes should not be checked
-ignored-modules=
-"""
-
-        config_path.write_text(config_content, encoding="utf-8")
+        config_path.write_bytes(PYLINTRC_BYTES)
         return config_path
 
     def create_formatter_config(self) -> Path | None:
@@ -334,33 +495,17 @@ ignored-modules=
         # Check if black config already exists
         content = pyproject_path.read_text(encoding="utf-8")
 
-        if "[tool.black]" in content:
+        try:
+            has_black_config = "black" in tomllib.loads(content).get("tool", {})
+        except tomllib.TOMLDecodeError:
+            has_black_config = "[tool.black]" in content
+
+        if has_black_config:
             return pyproject_path
 
         # Append black configuration
-        black_config = """
-
-[tool.black]
-line-length = 100
-target-version = ['py311']
-include = '\\.pyi?$'
-extend-exclude = '''
-/(
-  # directories
-  \\.eggs
-  | \\.git
-  | \\.hg
-  | \\.mypy_cache
-  | \\.tox
-  | \\.venv
-  | build
-  | dist
-)/
-'''
-"""
-
-        with open(pyproject_path, "a", encoding="utf-8") as f:
-            f.write(black_config)
+        with open(pyproject_path, "ab") as f:
+            f.write(BLACK_CONFIG_BYTES)
 
         return pyproject_path
 
@@ -379,26 +524,26 @@ extend-exclude = '''
 
         doc_path = self.project_root / "complexity-justification.md"
 
-        lines = [
-            "# Complexity Justification",
-            "",
-            "This document lists functions with cyclomatic complexity > 10 and justifications.",
-            "",
-            "## High Complexity Functions",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(
+            "# Complexity Justification\n"
+            "\n"
+            "This document lists functions with cyclomatic complexity > 10 and justifications.\n"
+            "\n"
+            "## High Complexity Functions\n"
+        )
 
         for file_path, funcs in sorted(violations.items()):
-            lines.append(f"### {file_path}")
-            lines.append("")
+            buf.write(f"\n### {file_path}\n")
 
             for func in funcs:
-                lines.append(f"**Function**: `{func['function']}`")
-                lines.append(f"- **Complexity**: {func['complexity']}")
-                lines.append(f"- **Location**: {func['location']}")
-                lines.append("- **Justification**: TODO - Document why this complexity is necessary")
-                lines.append("- **Refactoring Plan**: TODO - Outline plan to reduce complexity if possible")
-                lines.append("")
-
-        doc_path.write_text("\n".join(lines), encoding="utf-8")
+                buf.write(
+                    f"\n**Function**: `{func['function']}`\n"
+                    f"- **Complexity**: {func['complexity']}\n"
+                    f"- **Location**: {func['location']}\n"
+                    "- **Justification**: TODO - Document why this complexity is necessary\n"
+                    "- **Refactoring Plan**: TODO - Outline plan to reduce complexity if possible\n"
+                )
+
+        doc_path.write_text(buf.getvalue(), encoding="utf-8")
         return doc_path
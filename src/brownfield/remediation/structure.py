@@ -1,13 +1,76 @@
 """Structure remediation - plan generation for manual refactoring with IDE tools."""
 
+import io
+import os
+import re
+import tomllib
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
 
 from brownfield.models.assessment import LanguageDetection
 from brownfield.plugins.registry import get_handler
+from brownfield.utils.file_operations import FileOperations
 from brownfield.utils.output_formatter import OutputFormatter
 
+try:
+    import ahocorasick
+except ImportError:  # optional dependency (pip install brownkit[fast])
+    ahocorasick = None
+
+# Source file suffix searched for import references, per language
+SOURCE_SUFFIXES = {"python": ".py", "javascript": ".js", "go": ".go"}
+
+# Reads release the GIL, so oversubscribe CPUs to keep the disk queue full
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files read ahead of the matcher; bounds how many file contents are held at once
+READ_AHEAD = READ_WORKERS * 2
+
+
+def _compile_name_matcher(names: Iterable[str]) -> Callable[[bytes], set[str]]:
+    """
+    Build a function returning which of names occur in raw file contents.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a single compiled regex alternation; either way all names are found in
+    one scan of the contents. Contents are never UTF-8 decoded: names are
+    matched as their UTF-8 bytes.
+
+    Args:
+        names: Module names to search for
+
+    Returns:
+        Callable mapping file bytes to the set of names found in them
+    """
+    needles = [(name, name.encode()) for name in names]
+
+    if ahocorasick is not None:
+        # The automaton works on str; latin-1 maps each byte to one character without validation
+        automaton = ahocorasick.Automaton()
+        for name, needle in needles:
+            automaton.add_word(needle.decode("latin-1"), name)
+        automaton.make_automaton()
+        return lambda content: {name for _, name in automaton.iter(content.decode("latin-1"))}
+
+    # Longest alternatives first, inside a lookahead so a match is reported at every start offset
+    alternation = b"|".join(re.escape(needle) for _, needle in sorted(needles, key=lambda item: -len(item[1])))
+    pattern = re.compile(b"(?=(" + alternation + b"))")
+
+    # Only the longest name starting at an offset is reported, and it implies every name it contains
+    implied = {needle: {name for name, other in needles if other in needle} for _, needle in needles}
+
+    def find_names(content: bytes) -> set[str]:
+        found = {match.group(1) for match in pattern.finditer(content)}
+        return set().union(*(implied[needle] for needle in found))
+
+    return find_names
+
 
 @dataclass
 class FileMoveOperation:
@@ -16,7 +79,7 @@ class FileMoveOperation:
     source: Path
     destination: Path
     reason: str
-    import_references: int = 0  # Number of files that import this module
+    import_references: int | None = None  # Files importing this module; counted when the plan is rendered
 
 
 @dataclass
@@ -39,20 +102,25 @@ class StructurePlanGenerator:
         self.language_detection = language_detection
         self.formatter = OutputFormatter()
         self.handler = get_handler(language_detection.language)
+        self._reference_index: dict[str, int] | None = None
+        self._source_list_cache: dict[str, list[Path]] = {}
+        self._root_entries: set[str] | None = None
 
     def analyze_structure(self) -> StructureAnalysis:
         """Analyze current structure and identify issues."""
         self.formatter.info("Analyzing project structure...")
 
+        # Rebuild file listings and reference counts on each analysis so results stay fresh
+        self._reference_index = None
+        self._source_list_cache.clear()
+        self._root_entries = None
+
         # Get standard structure from language handler
         standard_structure = self.handler.get_standard_structure()
 
         # Find missing directories
-        missing_dirs = []
-        for dir_name in standard_structure:
-            dir_path = self.project_root / dir_name
-            if not dir_path.exists():
-                missing_dirs.append(dir_path)
+        root_entries = self._scan_root()
+        missing_dirs = [self.project_root / dir_name for dir_name in standard_structure if dir_name not in root_entries]
 
         # Identify files that need to be moved
         files_to_move = self._identify_files_to_move(standard_structure)
@@ -90,24 +158,20 @@ class StructurePlanGenerator:
         moves = []
 
         # Find .py files in root directory
-        for py_file in self.project_root.glob("*.py"):
+        for py_file in self._get_root_files(".py"):
             # Skip special files
             if py_file.name in ["setup.py", "conftest.py", "manage.py", "__init__.py"]:
                 continue
 
             # Determine destination
-            project_name = self._get_project_name() or "project"
+            project_name = self.project_name or "project"
             dest = self.project_root / "src" / project_name / py_file.name
 
-            # Count import references (simplified)
-            import_count = self._count_import_references(py_file)
-
             moves.append(
                 FileMoveOperation(
                     source=py_file,
                     destination=dest,
                     reason=f"Move to standard src/{project_name}/ structure (PEP 518)",
-                    import_references=import_count,
                 )
             )
 
@@ -117,20 +181,18 @@ class StructurePlanGenerator:
         """Identify JavaScript files that need to be moved."""
         moves = []
 
-        for js_file in self.project_root.glob("*.js"):
+        for js_file in self._get_root_files(".js"):
             # Skip config files
             if js_file.name.endswith("config.js") or js_file.name.endswith(".config.js"):
                 continue
 
             dest = self.project_root / "src" / js_file.name
-            import_count = self._count_import_references(js_file)
 
             moves.append(
                 FileMoveOperation(
                     source=js_file,
                     destination=dest,
                     reason="Move to standard src/ structure",
-                    import_references=import_count,
                 )
             )
 
@@ -140,7 +202,7 @@ class StructurePlanGenerator:
         """Identify Go files that need to be moved."""
         moves = []
 
-        for go_file in self.project_root.glob("*.go"):
+        for go_file in self._get_root_files(".go"):
             if go_file.name == "main.go":
                 dest = self.project_root / "cmd" / "app" / go_file.name
                 reason = "Move main.go to cmd/app/ (Go conventions)"
@@ -148,14 +210,11 @@ class StructurePlanGenerator:
                 dest = self.project_root / "pkg" / go_file.stem / go_file.name
                 reason = "Move to pkg/ structure (Go conventions)"
 
-            import_count = self._count_import_references(go_file)
-
             moves.append(
                 FileMoveOperation(
                     source=go_file,
                     destination=dest,
                     reason=reason,
-                    import_references=import_count,
                 )
             )
 
@@ -163,31 +222,112 @@ class StructurePlanGenerator:
 
     def _count_import_references(self, file_path: Path) -> int:
         """Count how many files import this module (simplified)."""
-        module_name = file_path.stem
-        count = 0
-
-        # Search for imports of this module
-        if self.language_detection.language == "python":
-            pattern = "**/*.py"
-        elif self.language_detection.language == "javascript":
-            pattern = "**/*.js"
-        elif self.language_detection.language == "go":
-            pattern = "**/*.go"
-        else:
-            return 0
-
-        for source_file in self.project_root.rglob(pattern):
-            if source_file == file_path:
-                continue
-
-            try:
-                content = source_file.read_text(encoding="utf-8")
-                if module_name in content:
-                    count += 1
-            except (UnicodeDecodeError, PermissionError):
-                pass
-
-        return count
+        if self._reference_index is None:
+            self._reference_index = self._build_reference_index()
+        return self._reference_index.get(file_path.stem, 0)
+
+    def _build_reference_index(self) -> dict[str, int]:
+        """
+        Count references to every root-level module in one pass over the sources.
+
+        Each source file is read once and searched for all candidate module
+        names together, instead of re-reading the tree per candidate.
+
+        Returns:
+            Mapping of module name to number of other files mentioning it
+        """
+        suffix = SOURCE_SUFFIXES.get(self.language_detection.language)
+        if suffix is None:
+            return {}
+
+        # Candidates are the root-level files that may be moved
+        candidates = {path.stem: path for path in self._get_root_files(suffix)}
+        if not candidates:
+            return {}
+
+        find_names = _compile_name_matcher(candidates)
+        counts = dict.fromkeys(candidates, 0)
+
+        source_files = iter(self._get_sources(suffix))
+
+        # Overlap file reads across threads, keeping at most READ_AHEAD files in flight;
+        # matching stays on this thread and each file's bytes are dropped once searched
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            pending = deque(
+                (source_file, executor.submit(self._read_source, source_file))
+                for source_file in islice(source_files, READ_AHEAD)
+            )
+            while pending:
+                source_file, future = pending.popleft()
+                next_file = next(source_files, None)
+                if next_file is not None:
+                    pending.append((next_file, executor.submit(self._read_source, next_file)))
+
+                content = future.result()
+                if content is None:
+                    continue
+
+                for name in find_names(content):
+                    if candidates[name] != source_file:
+                        counts[name] += 1
+
+        return counts
+
+    def _scan_root(self) -> set[str]:
+        """
+        List the project root once per analysis.
+
+        A single os.scandir pass records every entry name (for directory
+        checks) and groups regular files by source suffix (for move
+        candidates), reusing each entry's cached type instead of stat-ing paths.
+
+        Returns:
+            Names of all entries directly under the project root
+        """
+        if self._root_entries is None:
+            self._root_entries = set()
+            root_files = {suffix: [] for suffix in SOURCE_SUFFIXES.values()}
+
+            with os.scandir(self.project_root) as entries:
+                for entry in entries:
+                    self._root_entries.add(entry.name)
+                    suffix = os.path.splitext(entry.name)[1]
+                    if suffix in root_files and entry.is_file(follow_symlinks=False):
+                        root_files[suffix].append(Path(entry.path))
+
+            self._source_list_cache.update(root_files)
+
+        return self._root_entries
+
+    def _get_root_files(self, suffix: str) -> list[Path]:
+        """List regular files directly under the project root with the given suffix."""
+        self._scan_root()
+        return self._source_list_cache.get(suffix, [])
+
+    def _get_sources(self, suffix: str) -> list[Path]:
+        """List source files anywhere in the project, skipping vendored and build directories."""
+        key = f"**/*{suffix}"
+        if key not in self._source_list_cache:
+            self._source_list_cache[key] = [
+                Path(entry.path) for entry in FileOperations.iter_files(self.project_root, (suffix,))
+            ]
+        return self._source_list_cache[key]
+
+    @staticmethod
+    def _read_source(path: Path) -> bytes | None:
+        """
+        Load a source file for searching.
+
+        Args:
+            path: Source file to load
+
+        Returns:
+            File bytes, or None if the file is unreadable
+        """
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
 
     def _identify_missing_configs(self) -> dict[str, str]:
         """Identify configuration files that should be created."""
@@ -196,24 +336,24 @@ class StructurePlanGenerator:
         if self.language_detection.language == "python":
             pyproject_path = self.project_root / "pyproject.toml"
             if not pyproject_path.exists():
-                project_name = self._get_project_name() or "project"
+                project_name = self.project_name or "project"
                 configs["pyproject.toml"] = self._generate_python_pyproject(project_name)
 
         return configs
 
-    def _get_project_name(self) -> str | None:
-        """Extract project name from existing configuration or directory name."""
+    @cached_property
+    def project_name(self) -> str | None:
+        """Project name from existing configuration or directory name, read once per generator."""
         # Try pyproject.toml
         pyproject_path = self.project_root / "pyproject.toml"
         if pyproject_path.exists():
             try:
-                content = pyproject_path.read_text(encoding="utf-8")
-                for line in content.split("\n"):
-                    if line.strip().startswith("name"):
-                        parts = line.split("=")
-                        if len(parts) > 1:
-                            return parts[1].strip().strip('"').strip("'")
-            except Exception:
+                data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+                # PEP 621 [project] table, else Poetry's [tool.poetry]
+                name = data.get("project", {}).get("name") or data.get("tool", {}).get("poetry", {}).get("name")
+                if name:
+                    return name
+            except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
                 pass
 
         # Try package.json
@@ -245,10 +385,11 @@ build-backend = "setuptools.build_meta"
 
     def generate_markdown_plan(self, analysis: StructureAnalysis) -> str:
         """Generate detailed markdown refactoring plan."""
-        project_name = self._get_project_name() or "project"
+        project_name = self.project_name or "project"
         timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
 
-        plan = f"""# Structure Refactoring Plan
+        buf = io.StringIO()
+        buf.write(f"""# Structure Refactoring Plan
 
 **Generated**: {timestamp}
 **Language**: {self.language_detection.language}
@@ -256,26 +397,26 @@ build-backend = "setuptools.build_meta"
 
 ## Overview
 
-"""
+""")
 
         if analysis.compliant:
-            plan += "✅ Project structure already follows ecosystem conventions!\n\n"
-            plan += "No refactoring needed.\n"
-            return plan
+            buf.write("✅ Project structure already follows ecosystem conventions!\n\n")
+            buf.write("No refactoring needed.\n")
+            return buf.getvalue()
 
-        plan += f"""Moving {len(analysis.files_to_move)} files to standard {self.language_detection.language} structure.
+        buf.write(f"""Moving {len(analysis.files_to_move)} files to standard {self.language_detection.language} structure.
 
 ⚠️  **IMPORTANT**: Use your IDE's refactoring tools to ensure imports are updated correctly!
 
 ## Step 1: Create Directories
 
-"""
+""")
 
         for directory in analysis.missing_directories:
             rel_path = directory.relative_to(self.project_root)
-            plan += f"- [ ] Create `{rel_path}/`\n"
+            buf.write(f"- [ ] Create `{rel_path}/`\n")
 
-        plan += f"""
+        buf.write(f"""
 ```bash
 # Create all directories at once:
 mkdir -p {" ".join(str(d.relative_to(self.project_root)) for d in analysis.missing_directories)}
@@ -288,10 +429,10 @@ mkdir -p {" ".join(str(d.relative_to(self.project_root)) for d in analysis.missi
 BrownKit does NOT move files automatically to avoid breaking your code with
 naive import updates. Your IDE has proper AST parsing and will update imports correctly.
 
-"""
+""")
 
         if self.language_detection.language == "python":
-            plan += """**PyCharm Users:**
+            buf.write("""**PyCharm Users:**
 1. Right-click file → **Refactor** → **Move File**
 2. Select destination directory (e.g., `src/{project}`)
 3. ✅ Enable "**Search for references**" (updates imports automatically)
@@ -309,9 +450,9 @@ naive import updates. Your IDE has proper AST parsing and will update imports co
 - Use LSP refactoring commands if available
 - OR use shell script below + manual import fixes
 
-"""
+""")
         elif self.language_detection.language == "javascript":
-            plan += """**VSCode Users:**
+            buf.write("""**VSCode Users:**
 1. Drag file to `src/` in Explorer
 2. Confirm "**Update imports**" prompt
 3. Review and save changes
@@ -322,28 +463,30 @@ naive import updates. Your IDE has proper AST parsing and will update imports co
 3. Enable "Search for references"
 4. Apply changes
 
-"""
+""")
 
-        plan += "### Files to Move:\n\n"
+        buf.write("### Files to Move:\n\n")
 
         for move_op in analysis.files_to_move:
             rel_dest = move_op.destination.relative_to(self.project_root)
+            if move_op.import_references is None:
+                move_op.import_references = self._count_import_references(move_op.source)
             ref_note = f" (imported in {move_op.import_references} files)" if move_op.import_references > 0 else ""
-            plan += f"- [ ] `{move_op.source.name}` → `{rel_dest}`{ref_note}\n"
-            plan += f"     *Reason*: {move_op.reason}\n"
+            buf.write(f"- [ ] `{move_op.source.name}` → `{rel_dest}`{ref_note}\n")
+            buf.write(f"     *Reason*: {move_op.reason}\n")
 
-        plan += "\n## Step 3: Configuration Files\n\n"
+        buf.write("\n## Step 3: Configuration Files\n\n")
 
         if analysis.config_files_to_create:
             for filename, _content in analysis.config_files_to_create.items():
-                plan += f"- [ ] Create `{filename}`\n"
-            plan += "\n"
+                buf.write(f"- [ ] Create `{filename}`\n")
+            buf.write("\n")
         else:
-            plan += "No configuration files need to be created.\n\n"
+            buf.write("No configuration files need to be created.\n\n")
 
         # Add package __init__.py for Python
         if self.language_detection.language == "python" and analysis.files_to_move:
-            plan += f"""- [ ] Create `src/{project_name}/__init__.py`
+            buf.write(f"""- [ ] Create `src/{project_name}/__init__.py`
 
 ```python
 # src/{project_name}/__init__.py
@@ -352,9 +495,9 @@ naive import updates. Your IDE has proper AST parsing and will update imports co
 __version__ = "0.1.0"
 ```
 
-"""
+""")
 
-        plan += """## Step 4: Verify Structure
+        buf.write("""## Step 4: Verify Structure
 
 After completing the manual refactoring:
 
@@ -390,13 +533,14 @@ Only use this if you're comfortable manually updating imports or using find-repl
 2. ✅ Verify all imports work: `brownfield structure --verify`
 3. ✅ Commit changes: `git add . && git commit -m "refactor: reorganize project structure"`
 4. ✅ Continue to testing phase: `brownfield testing`
-"""
+""")
 
-        return plan
+        return buf.getvalue()
 
     def generate_shell_script(self, analysis: StructureAnalysis) -> str:
         """Generate shell script for file moves only (no import updates)."""
-        script = """#!/bin/bash
+        buf = io.StringIO()
+        buf.write("""#!/bin/bash
 # Structure Refactoring Script
 # Generated by BrownKit
 #
@@ -419,33 +563,35 @@ if [[ ! $REPLY =~ ^[Yy]$ ]]; then
     exit 0
 fi
 
-"""
+""")
 
         # Create directories
         if analysis.missing_directories:
-            script += "\n# Create missing directories\n"
+            buf.write("\n# Create missing directories\n")
             for directory in analysis.missing_directories:
                 rel_path = directory.relative_to(self.project_root)
-                script += f'echo "Creating {rel_path}/..."\n'
-                script += f"mkdir -p {rel_path}\n"
+                buf.write(f'echo "Creating {rel_path}/..."\n')
+                buf.write(f"mkdir -p {rel_path}\n")
 
         # Move files
         if analysis.files_to_move:
-            script += "\n# Move files\n"
+            buf.write("\n# Move files\n")
             for i, move_op in enumerate(analysis.files_to_move, 1):
                 rel_dest = move_op.destination.relative_to(self.project_root)
-                script += f'\necho "[{i}/{len(analysis.files_to_move)}] Moving {move_op.source.name} → {rel_dest}..."\n'
-                script += f"mkdir -p {rel_dest.parent}\n"
-                script += f"mv {move_op.source.name} {rel_dest}\n"
+                buf.write(
+                    f'\necho "[{i}/{len(analysis.files_to_move)}] Moving {move_op.source.name} → {rel_dest}..."\n'
+                )
+                buf.write(f"mkdir -p {rel_dest.parent}\n")
+                buf.write(f"mv {move_op.source.name} {rel_dest}\n")
 
         # Create __init__.py for Python packages
         if self.language_detection.language == "python" and analysis.files_to_move:
-            project_name = self._get_project_name() or "project"
-            script += "\n# Create package __init__.py\n"
-            script += f'echo "Creating src/{project_name}/__init__.py..."\n'
-            script += f'echo \'"""{project_name} package."""\' > src/{project_name}/__init__.py\n'
+            project_name = self.project_name or "project"
+            buf.write("\n# Create package __init__.py\n")
+            buf.write(f'echo "Creating src/{project_name}/__init__.py..."\n')
+            buf.write(f'echo \'"""{project_name} package."""\' > src/{project_name}/__init__.py\n')
 
-        script += """
+        buf.write("""
 echo ""
 echo "✓ File moves complete!"
 echo ""
@@ -454,6 +600,6 @@ echo "   Or use your IDE's refactoring tools to fix imports."
 echo ""
 echo "Verify structure after fixing imports:"
 echo "  brownfield structure --verify"
-"""
+""")
 
-        return script
+        return buf.getvalue()
@@ -1,12 +1,49 @@
 """Testing infrastructure bootstrapping."""
 
 import ast
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from brownfield.plugins.base import LanguageHandler, TestSetupResult
 from brownfield.state.decision_logger import DecisionLogger
+from brownfield.utils.coverage_report import read_total_coverage
+from brownfield.utils.file_operations import FileOperations
 from brownfield.utils.process_runner import ProcessRunner
 
+# Cap on modules selected for generated tests
+MAX_CORE_MODULES = 20
+
+# More than 50 code lines need at least 51 * 2 bytes (one character plus a newline each),
+# so smaller files are skipped without reading
+MIN_CORE_MODULE_BYTES = 51 * 2
+
+# "test" at the start of a path component or after a separator (test_x.py, tests/, x_test.py)
+TEST_PATH_PATTERN = re.compile(r"(?:^|[/_\.])test", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _load_ast(path_str: str, mtime_ns: int, size: int) -> ast.Module:
+    """Parse a module; mtime and size are part of the key so edited files are re-parsed."""
+    return ast.parse(Path(path_str).read_text(encoding="utf-8"))
+
+
+def _parse_module(module_path: Path) -> ast.Module | None:
+    """
+    Parse a Python module, reusing the tree while the file is unchanged.
+
+    Args:
+        module_path: Path to module
+
+    Returns:
+        Parsed module, or None if it cannot be read or parsed
+    """
+    try:
+        stat = module_path.stat()
+        return _load_ast(str(module_path), stat.st_mtime_ns, stat.st_size)
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+        return None
+
 
 class TestingBootstrapper:
     """Bootstrap test infrastructure for brownfield projects."""
@@ -21,6 +58,8 @@ class TestingBootstrapper:
         """
         self.handler = handler
         self.project_root = project_root
+        self._src_dir = project_root / "src"
+        self._import_paths: dict[Path, str] = {}
         self.decision_logger = DecisionLogger(project_root / ".specify" / "memory" / "brownfield-decisions.md")
 
     def bootstrap(
@@ -80,13 +119,17 @@ class TestingBootstrapper:
 
         for source_dir in source_dirs:
             if source_dir.exists() and source_dir.is_dir():
-                # Find Python files (extend for other languages)
-                for py_file in source_dir.rglob("*.py"):
+                # Find Python files (extend for other languages), pruning vendored directories
+                for entry in FileOperations.iter_files(source_dir, (".py",)):
+                    py_file = Path(entry.path)
                     # Skip test files, __init__.py, and setup files
                     if self._is_core_module(py_file):
                         core_modules.append(py_file)
+                        # Limit to top 20 files to avoid overwhelming
+                        if len(core_modules) == MAX_CORE_MODULES:
+                            return core_modules
 
-        return core_modules[:20]  # Limit to top 20 files to avoid overwhelming
+        return core_modules
 
     def _is_core_module(self, file_path: Path) -> bool:
         """
@@ -98,8 +141,12 @@ class TestingBootstrapper:
         Returns:
             True if file is core business logic
         """
-        # Skip test files
-        if "test" in file_path.name.lower() or "test" in str(file_path.parent).lower():
+        # Skip test files; only the part inside the project counts, so a checkout under tests/ still works
+        try:
+            relative_path = file_path.relative_to(self.project_root)
+        except ValueError:
+            relative_path = file_path
+        if TEST_PATH_PATTERN.search(relative_path.as_posix()):
             return False
 
         # Skip __init__.py
@@ -112,10 +159,11 @@ class TestingBootstrapper:
 
         # File should have substantive code (>50 lines)
         try:
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
-                code_lines = [line for line in lines if line.strip() and not line.strip().startswith("#")]
-                return len(code_lines) > 50
+            if file_path.stat().st_size < MIN_CORE_MODULE_BYTES:
+                return False
+            with open(file_path, encoding="utf-8", errors="ignore") as f:
+                code_lines = sum(1 for line in f if line.strip() and not line.lstrip().startswith("#"))
+            return code_lines > 50
         except Exception:
             return False
 
@@ -129,40 +177,31 @@ class TestingBootstrapper:
         Returns:
             List of generated test file paths
         """
-        test_files = []
+        test_dir = self.project_root / "tests"
+        test_dir.mkdir(parents=True, exist_ok=True)
 
+        # Modules that failed to parse produce no content and no test file
+        test_files = {}
         for module in modules:
-            test_file = self._create_smoke_test(module)
-            if test_file:
-                test_files.append(test_file)
+            test_content = self._generate_smoke_test_content(module)
+            if test_content:
+                test_files[test_dir / f"test_{module.stem}.py"] = test_content
 
-        return test_files
+        return self._write_test_files(test_files)
 
-    def _create_smoke_test(self, module_path: Path) -> Path | None:
+    def _write_test_files(self, test_files: dict[Path, str]) -> list[Path]:
         """
-        Create a smoke test for a module.
+        Write generated test files.
 
         Args:
-            module_path: Path to module
+            test_files: Content keyed by destination path
 
         Returns:
-            Path to created test file, or None if creation failed
+            List of written test file paths
         """
-        # Determine test file path
-        test_dir = self.project_root / "tests"
-        test_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create test file name
-        test_file = test_dir / f"test_{module_path.stem}.py"
-
-        # Generate smoke test content
-        test_content = self._generate_smoke_test_content(module_path)
-
-        if test_content:
-            test_file.write_text(test_content, encoding="utf-8")
-            return test_file
-
-        return None
+        for path, content in test_files.items():
+            path.write_text(content, encoding="utf-8")
+        return list(test_files)
 
     def _generate_smoke_test_content(self, module_path: Path) -> str:
         """
@@ -175,17 +214,18 @@ class TestingBootstrapper:
             Test file content as string
         """
         # Parse module to find classes and functions
-        try:
-            with open(module_path, encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-        except Exception:
+        tree = _parse_module(module_path)
+        if tree is None:
             return ""
 
-        # Extract top-level classes and functions
-        classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-        functions = [
-            node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef) and not node.name.startswith("_")
-        ]
+        # Extract top-level classes and functions in one pass over the module body
+        classes = []
+        functions = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes.append(node.name)
+            elif isinstance(node, ast.FunctionDef) and not node.name.startswith("_"):
+                functions.append(node.name)
 
         # Calculate module import path
         module_import = self._calculate_import_path(module_path)
@@ -236,16 +276,21 @@ class TestingBootstrapper:
         Returns:
             Import path string (e.g., "myproject.module")
         """
-        # Try to find src/ directory
-        src_dir = self.project_root / "src"
-        if src_dir in module_path.parents:
-            relative = module_path.relative_to(src_dir)
-        else:
+        # Smoke and contract generation both ask for the same modules
+        if module_path in self._import_paths:
+            return self._import_paths[module_path]
+
+        # Prefer paths relative to src/ when the module lives there
+        try:
+            relative = module_path.relative_to(self._src_dir)
+        except ValueError:
             relative = module_path.relative_to(self.project_root)
 
         # Convert path to module notation
         parts = list(relative.parts[:-1]) + [relative.stem]
-        return ".".join(parts)
+        import_path = ".".join(parts)
+        self._import_paths[module_path] = import_path
+        return import_path
 
     def generate_contract_tests(self, modules: list[Path]) -> list[Path]:
         """
@@ -260,44 +305,37 @@ class TestingBootstrapper:
         contract_test_dir = self.project_root / "tests" / "contract"
         contract_test_dir.mkdir(parents=True, exist_ok=True)
 
-        test_files = []
-
+        test_files = {}
         for module in modules:
-            test_file = self._create_contract_test(module, contract_test_dir)
-            if test_file:
-                test_files.append(test_file)
+            test_content = self._generate_contract_test_content(module)
+            if test_content:
+                test_files[contract_test_dir / f"test_{module.stem}_contract.py"] = test_content
 
-        return test_files
+        return self._write_test_files(test_files)
 
-    def _create_contract_test(self, module_path: Path, contract_test_dir: Path) -> Path | None:
+    def _generate_contract_test_content(self, module_path: Path) -> str:
         """
-        Create contract tests for a module's public APIs.
+        Generate contract test content for a module's public APIs.
 
         Args:
             module_path: Path to module
-            contract_test_dir: Directory for contract tests
 
         Returns:
-            Path to created test file, or None if creation failed
+            Test file content as string, or empty string if the module has no public functions
         """
         # Parse module to find public functions/methods
-        try:
-            with open(module_path, encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-        except Exception:
-            return None
+        tree = _parse_module(module_path)
+        if tree is None:
+            return ""
 
-        # Extract public functions (not starting with _)
+        # Extract public module-level functions (not starting with _); methods cannot be imported directly
         public_functions = []
-        for node in ast.walk(tree):
+        for node in tree.body:
             if isinstance(node, ast.FunctionDef) and not node.name.startswith("_"):
                 public_functions.append(node)
 
         if not public_functions:
-            return None
-
-        # Create test file
-        test_file = contract_test_dir / f"test_{module_path.stem}_contract.py"
+            return ""
 
         # Generate contract test content
         module_import = self._calculate_import_path(module_path)
@@ -326,8 +364,7 @@ class TestingBootstrapper:
             lines.append("    # TODO: Add assertions for error handling")
             lines.append("")
 
-        test_file.write_text("\n".join(lines), encoding="utf-8")
-        return test_file
+        return "\n".join(lines)
 
     def measure_coverage(self) -> float:
         """
@@ -358,13 +395,9 @@ class TestingBootstrapper:
             )
 
             # Parse coverage from JSON report
-            import json
-
             coverage_file = self.project_root / "coverage.json"
             if coverage_file.exists():
-                with open(coverage_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    return data.get("totals", {}).get("percent_covered", 0.0) / 100.0
+                return read_total_coverage(coverage_file) / 100.0
 
         except Exception:
             pass
@@ -1,11 +1,106 @@
 """Validation runner for checking all 7 readiness gates."""
 
-import json
+import itertools
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
 
+from brownfield.config import BrownfieldConfig
 from brownfield.models.assessment import Metrics
 from brownfield.models.gate import ReadinessGate
 from brownfield.plugins.base import LanguageHandler
+from brownfield.utils.cache import DiskCache, source_tree_fingerprint
+from brownfield.utils.coverage_report import read_total_coverage
+
+# Cached tool results older than this are recomputed even if sources are unchanged
+GATE_CACHE_MAX_AGE_SECONDS = 3600
+
+# Files in the shared state cache untouched this long are deleted at the start of a validation run
+CACHE_RETENTION_SECONDS = 7 * 24 * 3600
+
+
+# Constant fields of each gate; validators copy a template and fill in the measured values
+GATE_TEMPLATES: dict[str, ReadinessGate] = {
+    "Test Coverage": ReadinessGate(
+        name="Test Coverage",
+        description="Minimum test coverage on core business logic",
+        threshold=0.6,
+        current_value=0.0,
+        passed=False,
+        verification_command="pytest --cov=src --cov-report=json",
+        remediation_guidance="Run 'brownfield testing' to generate more tests",
+        exception_conditions=["Project is pure library with no business logic"],
+    ),
+    "Cyclomatic Complexity": ReadinessGate(
+        name="Cyclomatic Complexity",
+        description="Maximum cyclomatic complexity",
+        threshold=10.0,
+        current_value=0.0,
+        passed=False,
+        verification_command="lizard -C 10 src/",
+        remediation_guidance="Refactor complex functions or document justification",
+        exception_conditions=["Complexity justified in complexity-justification.md"],
+        justification_required=True,
+    ),
+    "Directory Structure": ReadinessGate(
+        name="Directory Structure",
+        description="Follows ecosystem conventions",
+        threshold=1.0,
+        current_value=0.0,
+        passed=False,
+        verification_command="brownfield structure --verify",
+        remediation_guidance="Run 'brownfield structure' to reorganize directories",
+    ),
+    "Build Status": ReadinessGate(
+        name="Build Status",
+        description="Build passes cleanly",
+        threshold=1.0,
+        current_value=0.0,
+        passed=False,
+        verification_command="language-specific",
+        remediation_guidance="Fix build errors and warnings",
+    ),
+    "API Documentation": ReadinessGate(
+        name="API Documentation",
+        description="Public APIs documented",
+        threshold=0.8,
+        current_value=0.0,
+        passed=False,
+        verification_command="manual",
+        remediation_guidance="Add docstrings/JSDoc to public functions/classes",
+    ),
+    "Security": ReadinessGate(
+        name="Security",
+        description="Zero critical vulnerabilities",
+        threshold=0.0,
+        current_value=0.0,
+        passed=False,
+        verification_command="bandit -r src/ -f json",
+        remediation_guidance="Run 'brownfield quality' to fix security issues",
+    ),
+    "Git Hygiene": ReadinessGate(
+        name="Git Hygiene",
+        description="No secrets or large binaries",
+        threshold=1.0,
+        current_value=0.0,
+        passed=False,
+        verification_command="manual",
+        remediation_guidance="Remove secrets and large files from git history",
+    ),
+}
+
+
+_gate_passed = attrgetter("passed")
+
+
+def _new_gate(name: str) -> ReadinessGate:
+    """Copy a gate template, giving the copy its own exception_conditions list."""
+    template = GATE_TEMPLATES[name]
+    return replace(template, exception_conditions=list(template.exception_conditions))
 
 
 class ValidationRunner:
@@ -16,10 +111,26 @@ class ValidationRunner:
         project_root: Path,
         handler: LanguageHandler,
         baseline_metrics: Metrics | None = None,
+        max_workers: int = 7,
+        use_cache: bool = True,
     ):
+        """
+        Initialize validation runner.
+
+        Args:
+            project_root: Project root directory
+            handler: Language-specific handler
+            baseline_metrics: Metrics from the initial assessment, if available
+            max_workers: Gates evaluated concurrently (1 runs them sequentially)
+            use_cache: Reuse build, complexity and security results while sources are unchanged
+        """
         self.project_root = project_root
         self.handler = handler
         self.baseline_metrics = baseline_metrics
+        self.max_workers = max_workers
+        self.cache = DiskCache(BrownfieldConfig.get_state_dir(project_root) / "cache") if use_cache else None
+        # Source fingerprint key for the current validate_all_gates run
+        self._tree_key: str | None = None
 
     def validate_all_gates(self) -> list[ReadinessGate]:
         """
@@ -28,42 +139,67 @@ class ValidationRunner:
         Returns:
             List of ReadinessGate objects with current_value and passed status updated
         """
-        gates = [
-            self._validate_test_coverage(),
-            self._validate_complexity(),
-            self._validate_directory_structure(),
-            self._validate_build_status(),
-            self._validate_api_documentation(),
-            self._validate_security(),
-            self._validate_git_hygiene(),
+        # Entries keyed by superseded source fingerprints are never read again, so drop them
+        if self.cache is not None:
+            self.cache.sweep_expired(CACHE_RETENTION_SECONDS)
+            # Walk the tree once; every cached gate shares this key
+            self._tree_key = source_tree_fingerprint(self.project_root, f"validation:{type(self.handler).__name__}")
+
+        validators = [
+            self._validate_test_coverage,
+            self._validate_complexity,
+            self._validate_directory_structure,
+            self._validate_build_status,
+            self._validate_api_documentation,
+            self._validate_security,
+            self._validate_git_hygiene,
         ]
 
-        return gates
+        # Gates are independent and mostly wait on subprocesses (build, lizard, bandit), so overlap them
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(validate) for validate in validators]
+            return [future.result() for future in futures]
+
+    def _cached_handler_call(
+        self, name: str, call: Callable[[Path], Any], is_tool_result: Callable[[Any], bool]
+    ) -> Any:
+        """
+        Run a handler check, reusing the result from an earlier run on an unchanged tree.
+
+        Handlers return zero or False defaults when their tool is missing or
+        fails, so only results accepted by is_tool_result are stored.
+
+        Args:
+            name: Check name used in the cache key
+            call: Handler method taking the project root
+            is_tool_result: Whether a result can only have come from a real tool run
+
+        Returns:
+            The handler method's result
+        """
+        if self.cache is None or self._tree_key is None:
+            return call(self.project_root)
+
+        cache_key = f"{self._tree_key}:{name}"
+        cached = self.cache.get(cache_key, GATE_CACHE_MAX_AGE_SECONDS)
+        if cached is not None:
+            return cached
+
+        result = call(self.project_root)
+        if is_tool_result(result):
+            self.cache.set(cache_key, result)
+        return result
 
     def _validate_test_coverage(self) -> ReadinessGate:
         """Gate 1: Test Coverage ≥60%."""
-        gate = ReadinessGate(
-            name="Test Coverage",
-            description="Minimum test coverage on core business logic",
-            threshold=0.6,
-            current_value=0.0,
-            passed=False,
-            verification_command="pytest --cov=src --cov-report=json",
-            remediation_guidance="Run 'brownfield testing' to generate more tests",
-            exception_conditions=["Project is pure library with no business logic"],
-        )
+        gate = _new_gate("Test Coverage")
 
         try:
             # Read coverage from coverage.json if it exists
             coverage_file = self.project_root / "coverage.json"
             if coverage_file.exists():
-                with open(coverage_file, encoding="utf-8") as f:
-                    coverage_data = json.load(f)
-                    # coverage.py JSON format has totals.percent_covered
-                    if "totals" in coverage_data:
-                        gate.current_value = coverage_data["totals"]["percent_covered"] / 100.0
-                    elif "percent_covered" in coverage_data.get("totals", {}):
-                        gate.current_value = coverage_data["totals"]["percent_covered"]
+                # coverage.py JSON format has totals.percent_covered; only that value is parsed
+                gate.current_value = read_total_coverage(coverage_file) / 100.0
         except Exception:
             # Coverage data unavailable
             pass
@@ -73,21 +209,14 @@ class ValidationRunner:
 
     def _validate_complexity(self) -> ReadinessGate:
         """Gate 2: Cyclomatic Complexity <10 (or documented)."""
-        gate = ReadinessGate(
-            name="Cyclomatic Complexity",
-            description="Maximum cyclomatic complexity",
-            threshold=10.0,
-            current_value=0.0,
-            passed=False,
-            verification_command="lizard -C 10 src/",
-            remediation_guidance="Refactor complex functions or document justification",
-            exception_conditions=["Complexity justified in complexity-justification.md"],
-            justification_required=True,
-        )
+        gate = _new_gate("Cyclomatic Complexity")
 
         try:
             # Use handler's measure_complexity method
-            complexity_data = self.handler.measure_complexity(self.project_root)
+            # Cache only real lizard runs: every measured function has a CCN of at least 1
+            complexity_data = self._cached_handler_call(
+                "complexity", self.handler.measure_complexity, lambda data: data.get("maximum", 0.0) > 0
+            )
             gate.current_value = complexity_data.get("maximum", 0.0)
 
             # Check if violations are documented
@@ -108,20 +237,11 @@ class ValidationRunner:
 
     def _validate_directory_structure(self) -> ReadinessGate:
         """Gate 3: Directory Structure follows ecosystem conventions."""
-        gate = ReadinessGate(
-            name="Directory Structure",
-            description="Follows ecosystem conventions",
-            threshold=1.0,
-            current_value=0.0,
-            passed=False,
-            verification_command="brownfield structure --verify",
-            remediation_guidance="Run 'brownfield structure' to reorganize directories",
-        )
+        gate = _new_gate("Directory Structure")
 
         try:
             # Check for standard structure directories
             standard_structure = self.handler.get_standard_structure()
-            found_dirs = 0
             total_dirs = len(standard_structure)
 
             if total_dirs == 0:
@@ -130,10 +250,10 @@ class ValidationRunner:
                 gate.passed = True
                 return gate
 
-            for dir_name in standard_structure:
-                dir_path = self.project_root / dir_name
-                if dir_path.exists() and dir_path.is_dir():
-                    found_dirs += 1
+            # One listing of the root replaces an exists/is_dir pair per standard directory
+            with os.scandir(self.project_root) as entries:
+                root_dirs = {entry.name for entry in entries if entry.is_dir()}
+            found_dirs = sum(1 for dir_name in standard_structure if dir_name in root_dirs)
 
             gate.current_value = found_dirs / total_dirs if total_dirs > 0 else 0.0
             gate.passed = gate.current_value >= gate.threshold
@@ -145,19 +265,12 @@ class ValidationRunner:
 
     def _validate_build_status(self) -> ReadinessGate:
         """Gate 4: Build Status - clean build (<10 warnings)."""
-        gate = ReadinessGate(
-            name="Build Status",
-            description="Build passes cleanly",
-            threshold=1.0,
-            current_value=0.0,
-            passed=False,
-            verification_command="language-specific",
-            remediation_guidance="Fix build errors and warnings",
-        )
+        gate = _new_gate("Build Status")
 
         try:
             # Use handler's verify_build method
-            build_passes = self.handler.verify_build(self.project_root)
+            # Cache only passing builds: a failure may just mean the build tool is missing
+            build_passes = self._cached_handler_call("build", self.handler.verify_build, bool)
             gate.current_value = 1.0 if build_passes else 0.0
             gate.passed = build_passes
 
@@ -169,15 +282,7 @@ class ValidationRunner:
 
     def _validate_api_documentation(self) -> ReadinessGate:
         """Gate 5: API Documentation ≥80% of public APIs documented."""
-        gate = ReadinessGate(
-            name="API Documentation",
-            description="Public APIs documented",
-            threshold=0.8,
-            current_value=0.0,
-            passed=False,
-            verification_command="manual",
-            remediation_guidance="Add docstrings/JSDoc to public functions/classes",
-        )
+        gate = _new_gate("API Documentation")
 
         # This is a manual gate for now
         # Could be enhanced with AST analysis to detect docstrings
@@ -188,19 +293,14 @@ class ValidationRunner:
 
     def _validate_security(self) -> ReadinessGate:
         """Gate 6: Security - 0 critical vulnerabilities."""
-        gate = ReadinessGate(
-            name="Security",
-            description="Zero critical vulnerabilities",
-            threshold=0.0,
-            current_value=0.0,
-            passed=False,
-            verification_command="bandit -r src/ -f json",
-            remediation_guidance="Run 'brownfield quality' to fix security issues",
-        )
+        gate = _new_gate("Security")
 
         try:
             # Use handler's scan_security method
-            security_counts = self.handler.scan_security(self.project_root)
+            # Cache only non-zero counts: all zeros is also what handlers return without a scanner
+            security_counts = self._cached_handler_call(
+                "security", self.handler.scan_security, lambda counts: any(counts.values())
+            )
             gate.current_value = float(security_counts.get("critical", 0))
             # Pass if 0 critical vulnerabilities
             gate.passed = gate.current_value == 0.0
@@ -213,15 +313,7 @@ class ValidationRunner:
 
     def _validate_git_hygiene(self) -> ReadinessGate:
         """Gate 7: Git Hygiene - no secrets, no large binaries."""
-        gate = ReadinessGate(
-            name="Git Hygiene",
-            description="No secrets or large binaries",
-            threshold=1.0,
-            current_value=0.0,
-            passed=False,
-            verification_command="manual",
-            remediation_guidance="Remove secrets and large files from git history",
-        )
+        gate = _new_gate("Git Hygiene")
 
         # This is a manual gate for now
         # Could be enhanced with gitleaks or similar tools
@@ -232,11 +324,11 @@ class ValidationRunner:
 
     def all_gates_passed(self, gates: list[ReadinessGate]) -> bool:
         """Check if all gates passed."""
-        return all(gate.passed for gate in gates)
+        return all(map(_gate_passed, gates))
 
     def get_failed_gates(self, gates: list[ReadinessGate]) -> list[ReadinessGate]:
         """Get list of gates that failed."""
-        return [gate for gate in gates if not gate.passed]
+        return list(itertools.filterfalse(_gate_passed, gates))
 
     def get_metrics_improvement(self) -> dict[str, dict[str, float]]:
         """
@@ -3,6 +3,8 @@
 from pathlib import Path
 
 from brownfield.models.checkpoint import PhaseCheckpoint
+from brownfield.utils import fast_json
+from brownfield.utils.file_operations import FileOperations
 
 
 class CheckpointStore:
@@ -12,13 +14,15 @@ class CheckpointStore:
         self.checkpoint_path = checkpoint_path
 
     def save(self, checkpoint: PhaseCheckpoint) -> None:
-        """Save checkpoint to file."""
+        """Save checkpoint to file, replacing any previous checkpoint atomically."""
         self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-        # TODO: Implement JSON serialization
+
+        # An interrupted write must never leave a truncated checkpoint behind
+        FileOperations.atomic_write_bytes(self.checkpoint_path, fast_json.dumps(checkpoint.to_dict(), indent=True))
 
     def load(self) -> PhaseCheckpoint:
         """Load checkpoint from file."""
-        # TODO: Implement JSON deserialization
+        return PhaseCheckpoint.from_dict(fast_json.loads(self.checkpoint_path.read_bytes()))
 
     def exists(self) -> bool:
         """Check if checkpoint file exists."""
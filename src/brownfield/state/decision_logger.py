@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from brownfield.models.decision import DecisionEntry
+from brownfield.utils.file_operations import FileOperations
 
 
 class DecisionLogger:
@@ -12,8 +13,22 @@ class DecisionLogger:
         self.log_path = log_path
 
     def log_decision(self, decision: DecisionEntry) -> None:
-        """Append decision to log file."""
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        """Append decision to log file.
+
+        Each entry is written with a single append and the file is closed
+        straight away, so logged decisions survive a crash and entries from
+        separate loggers never interleave.
+        """
+        entry = decision.to_markdown() + "\n---\n\n"
+        FileOperations.ensure_dir(self.log_path.parent)
+        try:
+            self._append(entry)
+        except FileNotFoundError:
+            # Directory was removed after it was first ensured
+            FileOperations.ensure_dir(self.log_path.parent, recheck=True)
+            self._append(entry)
+
+    def _append(self, entry: str) -> None:
+        """Append one entry to the log file and close it."""
         with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(decision.to_markdown())
-            f.write("\n---\n\n")
+            f.write(entry)
@@ -6,11 +6,13 @@ This migration:
 3. Archives old state file with timestamp
 """
 
-import json
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+from brownfield.utils import fast_json
+from brownfield.utils.file_operations import FileOperations
+
 
 def migrate_state_file(memory_dir: Path) -> bool:
     """Migrate old brownfield-state.json to Speckit-compatible state.json.
@@ -34,8 +36,7 @@ def migrate_state_file(memory_dir: Path) -> bool:
         shutil.copy(new_path, backup_path)
 
     # Load old state
-    with open(old_path, encoding="utf-8") as f:
-        state_dict = json.load(f)
+    state_dict = fast_json.loads(old_path.read_bytes())
 
     # Add workflow field if not present
     if "workflow" not in state_dict:
@@ -45,12 +46,8 @@ def migrate_state_file(memory_dir: Path) -> bool:
     if "schema_version" not in state_dict:
         state_dict["schema_version"] = "1.0"
 
-    # Write to new location atomically
-    temp_path = new_path.with_suffix(".tmp")
-    with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(state_dict, f, indent=2)
-
-    temp_path.rename(new_path)
+    # Write to new location atomically; a unique temp name keeps concurrent migrations apart
+    FileOperations.atomic_write_bytes(new_path, fast_json.dumps(state_dict, indent=True))
 
     # Archive old file (don't delete, keep for rollback)
     archive_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -72,21 +69,22 @@ def check_migration_needed(memory_dir: Path) -> str | None:
     old_path = memory_dir / "brownfield-state.json"
     new_path = memory_dir / "state.json"
 
-    if old_path.exists() and not new_path.exists():
-        return "Old state file exists, needs migration to state.json"
+    # Runs before most commands, so stat each path at most once
+    new_exists = new_path.exists()
 
-    if old_path.exists() and new_path.exists():
-        return "Both old and new state files exist, migration incomplete"
+    if old_path.exists():
+        if new_exists:
+            return "Both old and new state files exist, migration incomplete"
+        return "Old state file exists, needs migration to state.json"
 
     # Check if new state has workflow field
-    if new_path.exists():
+    if new_exists:
         try:
-            with open(new_path, encoding="utf-8") as f:
-                state_dict = json.load(f)
+            state_dict = fast_json.loads(new_path.read_bytes())
 
             if "workflow" not in state_dict:
                 return "state.json missing workflow field"
-        except (OSError, json.JSONDecodeError):
+        except (OSError, fast_json.JSONDecodeError):
             pass
 
     return None
@@ -101,15 +99,12 @@ def rollback_migration(memory_dir: Path) -> bool:
     Returns:
         True if rollback successful, False if no archive found
     """
-    import glob
-
-    # Find most recent archive
-    archives = sorted(glob.glob(str(memory_dir / "brownfield-state.json.archived_*")))
+    # Find most recent archive; the %Y%m%d_%H%M%S suffix orders names chronologically
+    most_recent_archive = max(memory_dir.glob("brownfield-state.json.archived_*"), key=lambda p: p.name, default=None)
 
-    if not archives:
+    if most_recent_archive is None:
         return False
 
-    most_recent_archive = Path(archives[-1])
     old_path = memory_dir / "brownfield-state.json"
 
     # Restore archive
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from brownfield.models.assessment import AssessmentReport
 from brownfield.models.report import GraduationReport
+from brownfield.utils.file_operations import FileOperations
 
 
 class ReportWriter:
@@ -12,13 +13,20 @@ class ReportWriter:
     @staticmethod
     def write_assessment_report(report: AssessmentReport, output_path: Path) -> None:
         """Write assessment report to file."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report.to_markdown())
+        ReportWriter._write(output_path, report.to_markdown())
 
     @staticmethod
     def write_graduation_report(report: GraduationReport, output_path: Path) -> None:
         """Write graduation report to file."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report.to_markdown())
+        ReportWriter._write(output_path, report.to_markdown())
+
+    @staticmethod
+    def _write(output_path: Path, content: str) -> None:
+        """Write content, creating the report directory on first use."""
+        FileOperations.ensure_dir(output_path.parent)
+        try:
+            output_path.write_text(content, encoding="utf-8")
+        except FileNotFoundError:
+            # Directory was removed after it was first ensured
+            FileOperations.ensure_dir(output_path.parent, recheck=True)
+            output_path.write_text(content, encoding="utf-8")
@@ -0,0 +1,9 @@
+"""Shared Rich console for utility modules.
+
+Creating a Console probes the terminal (TTY, color support, size), so the
+formatter, error handler and profiler share this single instance.
+"""
+
+from rich.console import Console
+
+console = Console()
@@ -7,27 +7,47 @@ Provides in-memory and disk caching for expensive operations:
 """
 
 import hashlib
-import json
+import os
+import pickle
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
+from datetime import date
 from functools import wraps
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import Any
+from uuid import UUID
 
 from brownfield.config import BrownfieldConfig
+from brownfield.utils import fast_json
+from brownfield.utils.file_operations import FileOperations
 
 
 class Cache:
-    """Simple in-memory cache with TTL support."""
+    """Simple in-memory LRU cache with TTL support.
 
-    def __init__(self, ttl_seconds: int = 300):
+    Holds at most ``maxsize`` entries, evicting the least recently used, and
+    sweeps expired entries every ``SWEEP_INTERVAL`` sets so memory stays
+    bounded in long-running processes. Safe to share between threads.
+    """
+
+    # Number of set() calls between sweeps for expired entries
+    SWEEP_INTERVAL = 64
+
+    def __init__(self, ttl_seconds: int = 300, maxsize: int = 1024):
         """Initialize cache with TTL.
 
         Args:
             ttl_seconds: Time-to-live in seconds (default: 5 minutes)
+            maxsize: Maximum number of entries kept (default: 1024)
         """
-        self._cache: dict[str, tuple[Any, float]] = {}
+        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
         self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._sets_since_sweep = 0
+        # Cached handler methods and file hashing run on worker threads
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Any | None:
         """Get value from cache if not expired.
@@ -38,15 +58,18 @@ class Cache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
 
-        value, timestamp = self._cache[key]
-        if time.time() - timestamp > self.ttl_seconds:
-            del self._cache[key]
-            return None
+            value, timestamp = entry
+            if time.time() - timestamp > self.ttl_seconds:
+                del self._cache[key]
+                return None
 
-        return value
+            self._cache.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any) -> None:
         """Set value in cache with current timestamp.
@@ -55,11 +78,24 @@ class Cache:
             key: Cache key
             value: Value to cache
         """
-        self._cache[key] = (value, time.time())
+        now = time.time()
+        with self._lock:
+            self._cache[key] = (value, now)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+            self._sets_since_sweep += 1
+            if self._sets_since_sweep >= self.SWEEP_INTERVAL:
+                self._sets_since_sweep = 0
+                expired = [k for k, (_, timestamp) in self._cache.items() if now - timestamp > self.ttl_seconds]
+                for k in expired:
+                    del self._cache[k]
 
     def clear(self) -> None:
         """Clear all cached values."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def invalidate(self, key: str) -> None:
         """Invalidate specific cache key.
@@ -67,13 +103,127 @@ class Cache:
         Args:
             key: Cache key to invalidate
         """
-        self._cache.pop(key, None)
+        with self._lock:
+            self._cache.pop(key, None)
 
 
 # Global in-memory cache
 _memory_cache = Cache(ttl_seconds=300)
 
 
+# Files whose changes invalidate cached analysis results: sources of every supported
+# language plus the manifests and tool configuration that affect what the tools report
+PROJECT_FINGERPRINT_SUFFIXES = (
+    ".py",
+    ".js",
+    ".jsx",
+    ".mjs",
+    ".cjs",
+    ".ts",
+    ".tsx",
+    ".go",
+    ".rs",
+    ".toml",
+    ".json",
+    ".cfg",
+    ".mod",
+    ".sum",
+    ".lock",
+    ".pylintrc",
+    ".bandit",
+)
+
+
+def compute_source_fingerprint(root: Path, suffixes: tuple[str, ...]) -> str:
+    """Compute a cheap change signature for source files under a directory.
+
+    Hashes the relative path, mtime and size of every file whose name ends
+    with one of ``suffixes``. File contents are never read, so this is fast
+    enough to run before every cached tool invocation.
+
+    Args:
+        root: Directory to scan
+        suffixes: File name suffixes (or exact names) to include
+
+    Returns:
+        Hex digest that changes whenever a matching file is added, removed or modified
+    """
+    entries = []
+    for entry in FileOperations.iter_files(root, suffixes):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append(f"{os.path.relpath(entry.path, root)}:{stat.st_mtime_ns}:{stat.st_size}")
+
+    entries.sort()
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+
+def source_tree_fingerprint(
+    project_root: Path, prefix: str, suffixes: tuple[str, ...] = PROJECT_FINGERPRINT_SUFFIXES
+) -> str:
+    """Build a cache key for results computed from a project tree.
+
+    Combines the resolved project root with its source fingerprint, so keyed
+    results are invalidated automatically when matching files change.
+
+    Args:
+        project_root: Project root directory
+        prefix: Key namespace (e.g. "quality:security")
+        suffixes: File name suffixes included in the fingerprint
+
+    Returns:
+        Cache key string
+    """
+    root = Path(project_root).resolve()
+    return f"{prefix}:{root}:{compute_source_fingerprint(root, suffixes)}"
+
+
+def source_tree_key(prefix: str, suffixes: tuple[str, ...] = PROJECT_FINGERPRINT_SUFFIXES) -> Callable[..., str]:
+    """Build a ``cache_result`` key function for methods taking a project root.
+
+    The returned key function expects ``(owner, project_root)`` arguments and
+    delegates to source_tree_fingerprint.
+
+    Args:
+        prefix: Key namespace (e.g. "python:complexity")
+        suffixes: File name suffixes included in the fingerprint
+
+    Usage:
+        @cache_result(key_func=source_tree_key("python:complexity"))
+        def measure_complexity(self, project_root):
+            ...
+    """
+
+    def key_func(_owner: Any, project_root: Path) -> str:
+        return source_tree_fingerprint(project_root, prefix, suffixes)
+
+    return key_func
+
+
+def _default_cache_key(qualname: str, args: tuple, kwargs: dict) -> str:
+    """Hash a function's qualified name and arguments into a fixed-size cache key.
+
+    Arguments are pickled, so values containing separators cannot collide the
+    way joined strings can; unpicklable arguments fall back to their repr.
+
+    Args:
+        qualname: Module-qualified function name
+        args: Positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        Hex digest identifying the call
+    """
+    call = (qualname, args, sorted(kwargs.items()))
+    try:
+        payload = pickle.dumps(call, protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        payload = repr(call).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 def cache_result(key_func: Callable | None = None, ttl_seconds: int = 300):
     """Decorator to cache function results in memory.
 
@@ -89,17 +239,15 @@ def cache_result(key_func: Callable | None = None, ttl_seconds: int = 300):
     """
 
     def decorator(func: Callable) -> Callable:
+        qualname = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key
             if key_func:
                 cache_key = key_func(*args, **kwargs)
             else:
-                # Default: hash function name + args
-                key_parts = [func.__name__]
-                key_parts.extend(str(arg) for arg in args)
-                key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-                cache_key = ":".join(key_parts)
+                cache_key = _default_cache_key(qualname, args, kwargs)
 
             # Check cache
             cached = _memory_cache.get(cache_key)
@@ -118,6 +266,30 @@ def cache_result(key_func: Callable | None = None, ttl_seconds: int = 300):
     return decorator
 
 
+def _normalize_cache_value(value: Any) -> Any:
+    """Convert the non-JSON types found in cache values in a single pass.
+
+    Dates and datetimes become ISO 8601 strings; paths and UUIDs become
+    strings. Everything else is returned as-is, so values must otherwise be
+    built from dict/list/tuple/str/int/float/bool/None.
+
+    Args:
+        value: Value to normalize
+
+    Returns:
+        Value that serializes without a ``default`` callback
+    """
+    if isinstance(value, dict):
+        return {key: _normalize_cache_value(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_normalize_cache_value(item) for item in value]
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, PurePath | UUID):
+        return str(value)
+    return value
+
+
 class DiskCache:
     """Disk-based cache for persistent storage."""
 
@@ -144,8 +316,8 @@ class DiskCache:
         Returns:
             Path to cache file
         """
-        # Hash key to avoid filesystem issues
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        # Hash key to avoid filesystem issues; keys need no cryptographic strength, so use a short BLAKE2b digest
+        key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return self.cache_dir / f"{key_hash}.json"
 
     def get(self, key: str, max_age_seconds: int | None = None) -> Any | None:
@@ -160,23 +332,25 @@ class DiskCache:
         """
         cache_path = self._get_cache_path(key)
 
-        if not cache_path.exists():
+        # Open first and stat the open file: one lookup, and no race between checking and reading
+        try:
+            with open(cache_path, "rb") as f:
+                # Check age if max_age specified
+                expired = bool(max_age_seconds) and time.time() - os.fstat(f.fileno()).st_mtime > max_age_seconds
+                raw = None if expired else f.read()
+        except FileNotFoundError:
             return None
 
-        # Check age if max_age specified
-        if max_age_seconds:
-            age = time.time() - cache_path.stat().st_mtime
-            if age > max_age_seconds:
-                cache_path.unlink()  # Delete expired cache
-                return None
+        if raw is None:
+            cache_path.unlink(missing_ok=True)  # Delete expired cache
+            return None
 
         try:
-            with cache_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("value")
-        except (json.JSONDecodeError, KeyError):
+            data = fast_json.loads(raw)
+            return data.get("value")
+        except (fast_json.JSONDecodeError, KeyError):
             # Corrupted cache file
-            cache_path.unlink()
+            cache_path.unlink(missing_ok=True)
             return None
 
     def set(self, key: str, value: Any) -> None:
@@ -184,19 +358,50 @@ class DiskCache:
 
         Args:
             key: Cache key
-            value: Value to cache (must be JSON-serializable)
+            value: Value to cache: JSON types plus dates, datetimes, paths and
+                UUIDs, which are stored as strings
+
+        Raises:
+            TypeError: If value contains any other type
         """
         cache_path = self._get_cache_path(key)
 
-        data = {"value": value, "timestamp": time.time()}
+        data = {"value": _normalize_cache_value(value), "timestamp": time.time()}
 
-        with cache_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        # Cache files are machine-read only, so skip pretty-printing
+        cache_path.write_bytes(fast_json.dumps(data))
 
     def clear(self) -> None:
         """Clear all disk cache files."""
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
+        self._remove_entries(lambda _entry: True)
+
+    def sweep_expired(self, max_age_seconds: int) -> None:
+        """Delete cache files older than max_age_seconds.
+
+        Args:
+            max_age_seconds: Maximum age in seconds
+        """
+        cutoff = time.time() - max_age_seconds
+        self._remove_entries(lambda entry: entry.stat().st_mtime < cutoff)
+
+    def _remove_entries(self, should_remove: Callable[[os.DirEntry], bool]) -> None:
+        """Delete cache files selected by should_remove, tolerating concurrent removal.
+
+        Args:
+            should_remove: Predicate applied to each cache file's directory entry
+        """
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        if should_remove(entry):
+                            os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+        except FileNotFoundError:
+            pass
 
     def invalidate(self, key: str) -> None:
         """Invalidate specific cache key.
@@ -204,9 +409,7 @@ class DiskCache:
         Args:
             key: Cache key to invalidate
         """
-        cache_path = self._get_cache_path(key)
-        if cache_path.exists():
-            cache_path.unlink()
+        self._get_cache_path(key).unlink(missing_ok=True)
 
 
 def disk_cache_result(key_func: Callable, max_age_seconds: int = 3600):
@@ -272,14 +475,10 @@ def memoize_file_hash(file_path: Path) -> str:
         if current_mtime == cached_mtime:
             return cached_hash
 
-    # Compute hash
-    sha256 = hashlib.sha256()
-    with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-
-    file_hash = sha256.hexdigest()
+    # Record mtime before hashing so an edit during hashing is caught next time
     mtime = file_path.stat().st_mtime
+    with file_path.open("rb") as f:
+        file_hash = hashlib.file_digest(f, "sha256").hexdigest()
 
     _memory_cache.set(cache_key, (file_hash, mtime))
     return file_hash
@@ -0,0 +1,40 @@
+"""Reading totals from coverage.py JSON reports.
+
+Coverage reports hold per-file line data and can run to many megabytes, while
+brownfield only needs the overall percentage. With ijson installed
+(``pip install brownkit[fast]``) the report is streamed and parsing stops at
+the totals; otherwise it is parsed whole.
+"""
+
+from pathlib import Path
+
+from brownfield.utils import fast_json
+
+try:
+    import ijson
+except ImportError:  # optional dependency (pip install brownkit[fast])
+    ijson = None
+
+
+def read_total_coverage(coverage_file: Path) -> float:
+    """Read totals.percent_covered from a coverage.py JSON report.
+
+    Args:
+        coverage_file: Path to coverage.json
+
+    Returns:
+        Total coverage percentage (0 to 100), or 0.0 if the report has no totals
+
+    Raises:
+        OSError: If the report cannot be read
+        ValueError: If the report is not valid JSON
+    """
+    with open(coverage_file, "rb") as f:
+        if ijson is not None:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "totals.percent_covered" and event == "number":
+                    return float(value)
+            return 0.0
+
+        data = fast_json.loads(f.read())
+    return data.get("totals", {}).get("percent_covered", 0.0)
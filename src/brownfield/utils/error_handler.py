@@ -5,12 +5,9 @@ import traceback
 from collections.abc import Callable
 from functools import wraps
 
-from rich.console import Console
-
 from brownfield.config import BrownfieldConfig
 from brownfield.exceptions import BrownfieldError
-
-console = Console()
+from brownfield.utils._console import console
 
 
 def handle_errors(func: Callable) -> Callable:
@@ -21,6 +18,9 @@ def handle_errors(func: Callable) -> Callable:
     - Catch unexpected errors and show traceback in debug mode
     - Exit with appropriate status code
 
+    Debug mode is read once, when the command is decorated: BROWNFIELD_DEBUG
+    is set before the CLI starts and does not change during a run.
+
     Usage:
         @click.command()
         @handle_errors
@@ -28,6 +28,7 @@ def handle_errors(func: Callable) -> Callable:
             # Your code here
             pass
     """
+    debug = BrownfieldConfig.is_debug_enabled()
 
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -46,7 +47,7 @@ def handle_errors(func: Callable) -> Callable:
         except Exception as e:
             # Handle unexpected errors
             console.print(f"\n[red]✗ Unexpected Error:[/red] {e}")
-            if BrownfieldConfig.is_debug_enabled():
+            if debug:
                 console.print("\n[dim]Traceback:[/dim]")
                 console.print(traceback.format_exc())
             else:
@@ -0,0 +1,90 @@
+"""JSON parsing and serialization with an optional orjson fast path.
+
+orjson parses raw bytes directly and is several times faster than the
+standard library on large tool reports (bandit, npm audit), coverage
+reports and state files. It is an optional dependency
+(``pip install brownkit[fast]``); without it the standard library ``json``
+module is used.
+"""
+
+import json
+import mmap
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+# Both parsers raise a subclass of this on malformed input
+JSONDecodeError = json.JSONDecodeError
+
+# Files at least this large are memory-mapped and parsed in place when orjson is available
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from str or bytes.
+
+    Args:
+        data: JSON document, preferably undecoded subprocess output (bytes)
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON.
+
+    Output matches the standard library's for the types brownfield writes:
+    datetimes and dataclasses go through ``default`` rather than orjson's
+    native handling, and non-string keys are converted to strings.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback for objects that are not natively serializable
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode("utf-8")
+
+
+def load_file(path: Path) -> Any:
+    """Parse a JSON file.
+
+    With orjson, large files are memory-mapped and parsed straight from the
+    mapping, skipping the intermediate bytes copy; small files (and the
+    standard library path) are read normally.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        OSError: If the file cannot be read
+        JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+        return loads(f.read())
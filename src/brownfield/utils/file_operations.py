@@ -1,20 +1,134 @@
 """File operations utilities."""
 
+import errno
+import os
 import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
+# Directories that never contain first-party project sources
+IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        "node_modules",
+        "__pycache__",
+        ".specify",
+        "dist",
+        "build",
+        "target",
+    }
+)
+
+# Directories created (or found) by ensure_dir in this process
+_ensured_dirs: set[Path] = set()
+_ensured_dirs_lock = threading.Lock()
+
 
 class FileOperations:
     """Safe file operations."""
 
+    @staticmethod
+    def ensure_dir(path: Path, recheck: bool = False) -> None:
+        """
+        Create a directory (and parents) unless this process already did so.
+
+        Repeated writes into the same directory skip the mkdir call. Pass
+        recheck=True after a write failed with FileNotFoundError, in case the
+        directory was removed since it was first ensured.
+
+        Args:
+            path: Directory to create
+            recheck: Ignore the record of earlier calls and create the directory again
+        """
+        if not recheck and path in _ensured_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        with _ensured_dirs_lock:
+            _ensured_dirs.add(path)
+
     @staticmethod
     def safe_move(src: Path, dst: Path) -> None:
-        """Safely move file."""
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(src), str(dst))
+        """Safely move file.
+
+        Same-filesystem moves are a single atomic rename; shutil.move's
+        copy-and-delete is only used across filesystems.
+        """
+        FileOperations.ensure_dir(dst.parent)
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dst))
 
     @staticmethod
     def safe_copy(src: Path, dst: Path) -> None:
-        """Safely copy file."""
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        """Safely copy file, preserving metadata."""
+        FileOperations.ensure_dir(dst.parent)
         shutil.copy2(str(src), str(dst))
+
+    @staticmethod
+    def atomic_write_bytes(path: Path, data: bytes) -> None:
+        """
+        Replace a file's content so readers see either the old or the new file, never a partial one.
+
+        Data is written to a uniquely named temp file in the same directory and
+        moved into place with os.replace; the temp file is removed on failure.
+
+        Args:
+            path: File to write
+            data: New content
+        """
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+            ) as f:
+                temp_path = Path(f.name)
+                f.write(data)
+            # Unlike Path.rename, os.replace also overwrites an existing destination on Windows
+            os.replace(temp_path, path)
+        except BaseException:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def iter_files(
+        root: Path, suffixes: tuple[str, ...], skip_dirs: frozenset[str] = IGNORED_DIRS
+    ) -> Iterator[os.DirEntry]:
+        """
+        Lazily yield files under root whose names end with one of suffixes.
+
+        Walks with an explicit stack of os.scandir calls and prunes skip_dirs,
+        so callers that only need a few matches can stop early without
+        traversing the whole tree.
+
+        Args:
+            root: Directory to walk
+            suffixes: File name suffixes (or exact names) to match
+            skip_dirs: Directory names that are never descended into
+
+        Yields:
+            os.DirEntry for each matching file
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(suffixes):
+                            yield entry
+            except OSError:
+                continue
@@ -1,26 +1,37 @@
 """Rich console output formatting."""
 
-from rich.console import Console
+from rich.text import Text
+
+from brownfield.utils._console import console
 
 
 class OutputFormatter:
-    """Rich UI formatting."""
+    """Rich UI formatting.
+
+    Messages are printed as plain text: they are not parsed for Rich markup
+    or highlighted, so only the styled prefix symbols are colored.
+    """
+
+    SUCCESS_PREFIX = Text("✓", style="green")
+    ERROR_PREFIX = Text("✗", style="red")
+    WARNING_PREFIX = Text("⚠", style="yellow")
+    INFO_PREFIX = Text("ℹ", style="blue")
 
     def __init__(self):
-        self.console = Console()
+        self.console = console
 
     def success(self, message: str) -> None:
         """Print success message."""
-        self.console.print(f"[green]✓[/green] {message}")
+        self.console.print(self.SUCCESS_PREFIX, message, markup=False, highlight=False)
 
     def error(self, message: str) -> None:
         """Print error message."""
-        self.console.print(f"[red]✗[/red] {message}")
+        self.console.print(self.ERROR_PREFIX, message, markup=False, highlight=False)
 
     def warning(self, message: str) -> None:
         """Print warning message."""
-        self.console.print(f"[yellow]⚠[/yellow] {message}")
+        self.console.print(self.WARNING_PREFIX, message, markup=False, highlight=False)
 
     def info(self, message: str) -> None:
         """Print info message."""
-        self.console.print(f"[blue]ℹ[/blue] {message}")
+        self.console.print(self.INFO_PREFIX, message, markup=False, highlight=False)
@@ -1,10 +1,52 @@
 """Process execution utilities with NixOS/devenv awareness."""
 
+import contextlib
 import os
 import shutil
+import signal
 import subprocess
+import threading
+import time
+from functools import cache, lru_cache
 from pathlib import Path
 
+# Grace period between SIGTERM and SIGKILL when stopping a stalled process
+TERMINATE_GRACE_SECONDS = 5
+
+# How long to wait for output readers once a stopped process group is gone
+READER_JOIN_SECONDS = 5
+
+
+@lru_cache(maxsize=128)
+def _find_devenv_root_cached(resolved_start: str) -> tuple[Path, str] | None:
+    """Walk up from an already-resolved directory to find devenv.nix or flake.nix.
+
+    Results are cached per directory for the life of the process: a
+    project's devenv/flake layout does not change during a CLI run.
+    """
+    current = Path(resolved_start)
+
+    # Walk up to root, checking each directory (the root itself included) with one readdir
+    while True:
+        try:
+            with os.scandir(current) as entries:
+                names = {entry.name for entry in entries if not entry.is_dir(follow_symlinks=False)}
+        except (PermissionError, FileNotFoundError):
+            names = set()
+        if "devenv.nix" in names:
+            return (current, "devenv")
+        if "flake.nix" in names:
+            return (current, "flake")
+        if current == current.parent:
+            return None
+        current = current.parent
+
+
+@cache
+def _which_cached(tool: str) -> str | None:
+    """Look up a dev environment launcher (devenv, nix) on PATH once per process."""
+    return shutil.which(tool)
+
 
 class ProcessRunner:
     """Shell-aware subprocess wrapper for language tools."""
@@ -20,23 +62,7 @@ class ProcessRunner:
         Returns:
             Tuple of (root_path, type) where type is "devenv" or "flake", or None
         """
-        current = start_path.resolve()
-
-        # Walk up to root, checking each directory
-        while current != current.parent:
-            if (current / "devenv.nix").exists():
-                return (current, "devenv")
-            if (current / "flake.nix").exists():
-                return (current, "flake")
-            current = current.parent
-
-        # Check root directory
-        if (current / "devenv.nix").exists():
-            return (current, "devenv")
-        if (current / "flake.nix").exists():
-            return (current, "flake")
-
-        return None
+        return _find_devenv_root_cached(str(start_path.resolve()))
 
     @staticmethod
     def _detect_shell_context(cwd: str | Path | None = None) -> tuple[str, Path | None]:
@@ -82,7 +108,13 @@ class ProcessRunner:
         return ("system", None)
 
     @staticmethod
-    def run(cmd: list[str], cwd: str | None = None, timeout: int = 300, **kwargs) -> subprocess.CompletedProcess:
+    def run(
+        cmd: list[str],
+        cwd: str | None = None,
+        timeout: int = 300,
+        idle_timeout: float | None = None,
+        **kwargs,
+    ) -> subprocess.CompletedProcess:
         """
         Run subprocess with timeout and shell context awareness.
 
@@ -95,20 +127,25 @@ class ProcessRunner:
             cmd: Command and arguments as list
             cwd: Working directory for the command to execute in
             timeout: Timeout in seconds
+            idle_timeout: Stop the process if it writes nothing to stdout/stderr for this
+                many seconds. Only useful for tools that stream output while working.
             **kwargs: Additional arguments passed to subprocess.run
 
         Returns:
             CompletedProcess result
+
+        Raises:
+            subprocess.TimeoutExpired: If timeout or idle_timeout is exceeded
         """
         command_name = cmd[0]
         context_type, devenv_root = ProcessRunner._detect_shell_context(cwd)
 
         # If command doesn't exist and we have a dev environment available, wrap it
         if not shutil.which(command_name):
-            if context_type == "devenv-available" and shutil.which("devenv") and devenv_root:
+            if context_type == "devenv-available" and _which_cached("devenv") and devenv_root:
                 # Wrap in devenv shell - the shell command inherits the cwd
                 cmd = ["devenv", "shell", "--"] + cmd
-            elif context_type == "flake-available" and shutil.which("nix") and devenv_root:
+            elif context_type == "flake-available" and _which_cached("nix") and devenv_root:
                 # Wrap in nix develop - the command inherits the cwd
                 cmd = ["nix", "develop", "-c"] + cmd
 
@@ -120,4 +157,99 @@ class ProcessRunner:
         }
         default_kwargs.update(kwargs)
 
+        if idle_timeout is not None and default_kwargs.pop("capture_output"):
+            return ProcessRunner._run_with_idle_timeout(cmd, cwd, idle_timeout, **default_kwargs)
+
         return subprocess.run(cmd, cwd=cwd, **default_kwargs)
+
+    @staticmethod
+    def _run_with_idle_timeout(
+        cmd: list[str],
+        cwd: str | None,
+        idle_timeout: float,
+        text: bool = True,
+        timeout: float | None = None,
+        **popen_kwargs,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a process, stopping it early once its output goes quiet.
+
+        Reader threads drain stdout and stderr and record when bytes last
+        arrived. If nothing arrives for idle_timeout seconds (or the overall
+        timeout passes) the process group gets SIGTERM, then SIGKILL after a
+        short grace period, so wrapped commands (devenv shell, nix develop)
+        and forked children are stopped too.
+
+        Raises:
+            subprocess.TimeoutExpired: If the process stalled or ran too long
+        """
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+            **popen_kwargs,
+        )
+        chunks: dict[str, list[bytes]] = {"stdout": [], "stderr": []}
+        last_activity = [time.monotonic()]
+
+        def drain(stream, name: str) -> None:
+            for chunk in iter(lambda: stream.read1(65536), b""):
+                chunks[name].append(chunk)
+                last_activity[0] = time.monotonic()
+            stream.close()
+
+        readers = [
+            threading.Thread(target=drain, args=(process.stdout, "stdout"), daemon=True),
+            threading.Thread(target=drain, args=(process.stderr, "stderr"), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        started = time.monotonic()
+        poll_interval = min(1.0, idle_timeout / 4)
+        expired_after = None
+
+        while True:
+            try:
+                process.wait(timeout=poll_interval)
+                break
+            except subprocess.TimeoutExpired:
+                now = time.monotonic()
+                if now - last_activity[0] > idle_timeout:
+                    expired_after = idle_timeout
+                elif timeout is not None and now - started > timeout:
+                    expired_after = timeout
+                else:
+                    continue
+
+            # Stalled or over budget: ask politely first, then force
+            ProcessRunner._signal_group(process, signal.SIGTERM)
+            with contextlib.suppress(subprocess.TimeoutExpired):
+                process.wait(timeout=TERMINATE_GRACE_SECONDS)
+            # Children that outlived the leader may still hold the pipes open
+            ProcessRunner._signal_group(process, signal.SIGKILL)
+            process.wait()
+            break
+
+        for reader in readers:
+            reader.join(timeout=READER_JOIN_SECONDS if expired_after is not None else None)
+
+        stdout = b"".join(chunks["stdout"])
+        stderr = b"".join(chunks["stderr"])
+        if text:
+            stdout = stdout.decode(errors="replace")
+            stderr = stderr.decode(errors="replace")
+
+        if expired_after is not None:
+            raise subprocess.TimeoutExpired(cmd, expired_after, output=stdout, stderr=stderr)
+
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+    @staticmethod
+    def _signal_group(process: subprocess.Popen, sig: int) -> None:
+        """Send sig to every process in the session started for process."""
+        # ProcessLookupError means the whole group has already exited
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(process.pid, sig)
@@ -8,19 +8,21 @@ from collections.abc import Callable
 from contextlib import contextmanager
 from functools import wraps
 
-from rich.console import Console
-
 from brownfield.config import BrownfieldConfig
-
-console = Console()
+from brownfield.utils._console import console
 
 
 class PerformanceTracker:
     """Track performance metrics for operations."""
 
     def __init__(self):
-        """Initialize performance tracker."""
-        self.timings: dict[str, list[float]] = {}
+        """Initialize performance tracker.
+
+        BROWNFIELD_DEBUG does not change during a run, so it is read once
+        here rather than on every measurement.
+        """
+        # Running aggregates per operation: memory stays constant however often an operation runs
+        self.stats: dict[str, dict[str, float]] = {}
         self.enabled = BrownfieldConfig.is_debug_enabled()
 
     def record(self, operation: str, duration: float) -> None:
@@ -33,9 +35,15 @@ class PerformanceTracker:
         if not self.enabled:
             return
 
-        if operation not in self.timings:
-            self.timings[operation] = []
-        self.timings[operation].append(duration)
+        stats = self.stats.get(operation)
+        if stats is None:
+            self.stats[operation] = {"min": duration, "max": duration, "total": duration, "count": 1}
+            return
+
+        stats["min"] = min(stats["min"], duration)
+        stats["max"] = max(stats["max"], duration)
+        stats["total"] += duration
+        stats["count"] += 1
 
     def get_stats(self, operation: str) -> dict[str, float]:
         """Get statistics for an operation.
@@ -46,27 +54,21 @@ class PerformanceTracker:
         Returns:
             Dictionary with min, max, avg, total times
         """
-        if operation not in self.timings or not self.timings[operation]:
+        stats = self.stats.get(operation)
+        if stats is None:
             return {"min": 0.0, "max": 0.0, "avg": 0.0, "total": 0.0, "count": 0}
 
-        timings = self.timings[operation]
-        return {
-            "min": min(timings),
-            "max": max(timings),
-            "avg": sum(timings) / len(timings),
-            "total": sum(timings),
-            "count": len(timings),
-        }
+        return {**stats, "avg": stats["total"] / stats["count"]}
 
     def print_summary(self) -> None:
         """Print performance summary to console."""
-        if not self.enabled or not self.timings:
+        if not self.enabled or not self.stats:
             return
 
         console.print("\n[bold]Performance Summary:[/bold]")
         console.print("=" * 60)
 
-        for operation, _timings in sorted(self.timings.items()):
+        for operation in sorted(self.stats):
             stats = self.get_stats(operation)
             console.print(f"\n[cyan]{operation}[/cyan]:")
             console.print(f"  Count: {stats['count']}")
@@ -79,13 +81,18 @@ class PerformanceTracker:
 
     def clear(self) -> None:
         """Clear all recorded timings."""
-        self.timings.clear()
+        self.stats.clear()
 
 
 # Global performance tracker
 _perf_tracker = PerformanceTracker()
 
 
+def _refresh_debug() -> None:
+    """Re-read BROWNFIELD_DEBUG, e.g. after a test changes the environment."""
+    _perf_tracker.enabled = BrownfieldConfig.is_debug_enabled()
+
+
 @contextmanager
 def measure_time(operation: str, print_result: bool = False):
     """Context manager to measure execution time.
@@ -99,6 +106,11 @@ def measure_time(operation: str, print_result: bool = False):
             # ... code to measure ...
             pass
     """
+    # Nothing would be recorded or printed, so skip the clock reads
+    if not (print_result or _perf_tracker.enabled):
+        yield
+        return
+
     start = time.perf_counter()
     try:
         yield
@@ -106,13 +118,16 @@ def measure_time(operation: str, print_result: bool = False):
         duration = time.perf_counter() - start
         _perf_tracker.record(operation, duration)
 
-        if print_result or BrownfieldConfig.is_debug_enabled():
+        if print_result or _perf_tracker.enabled:
             console.print(f"[dim]{operation}: {duration:.2f}s[/dim]")
 
 
 def timed(operation: str | None = None):
     """Decorator to measure function execution time.
 
+    Functions decorated while debug mode is off are returned unchanged, so
+    timing costs nothing in normal runs.
+
     Args:
         operation: Optional operation name (defaults to function name)
 
@@ -129,6 +144,10 @@ def timed(operation: str | None = None):
     """
 
     def decorator(func: Callable) -> Callable:
+        # Decided once at decoration time: outside debug mode the function is left unwrapped
+        if not _perf_tracker.enabled:
+            return func
+
         op_name = operation or func.__name__
 
         @wraps(func)
@@ -147,7 +166,7 @@ def get_performance_stats() -> dict[str, dict[str, float]]:
     Returns:
         Dictionary mapping operation names to their statistics
     """
-    return {op: _perf_tracker.get_stats(op) for op in _perf_tracker.timings}
+    return {op: _perf_tracker.get_stats(op) for op in _perf_tracker.stats}
 
 
 def print_performance_summary() -> None:
@@ -0,0 +1,79 @@
+"""Tests for cached handler analysis results."""
+
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from brownfield.plugins.python_handler import PythonHandler
+from brownfield.utils.cache import compute_source_fingerprint, source_tree_fingerprint, source_tree_key
+
+LIZARD_CSV = '2,4,10,0,2,"f@1-2@a.py","a.py","f","f( )",1,2\n'
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start each test with an empty in-memory cache."""
+    PythonHandler.measure_complexity.cache_clear()
+    yield
+    PythonHandler.measure_complexity.cache_clear()
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a minimal Python project."""
+    (tmp_path / "a.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    return tmp_path
+
+
+def _lizard_result():
+    return subprocess.CompletedProcess(args=["lizard"], returncode=0, stdout=LIZARD_CSV, stderr="")
+
+
+class TestSourceFingerprint:
+    """Test compute_source_fingerprint."""
+
+    def test_fingerprint_stable_without_changes(self, project):
+        assert compute_source_fingerprint(project, (".py",)) == compute_source_fingerprint(project, (".py",))
+
+    def test_fingerprint_changes_on_new_file(self, project):
+        before = compute_source_fingerprint(project, (".py",))
+        (project / "b.py").write_text("x = 1\n", encoding="utf-8")
+        assert compute_source_fingerprint(project, (".py",)) != before
+
+    def test_fingerprint_ignores_other_suffixes_and_vendored_dirs(self, project):
+        before = compute_source_fingerprint(project, (".py",))
+        (project / "notes.txt").write_text("hello", encoding="utf-8")
+        (project / "node_modules").mkdir()
+        (project / "node_modules" / "vendored.py").write_text("x = 1\n", encoding="utf-8")
+        assert compute_source_fingerprint(project, (".py",)) == before
+
+    def test_tree_key_matches_decorator_key(self, project):
+        key = source_tree_fingerprint(project, "python:complexity")
+        assert key.startswith(f"python:complexity:{project.resolve()}:")
+        assert source_tree_key("python:complexity")(object(), project) == key
+
+
+class TestMeasureComplexityCache:
+    """Test that repeated complexity measurements reuse lizard results."""
+
+    def test_repeat_call_reuses_result(self, project):
+        handler = PythonHandler()
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=_lizard_result()) as run:
+            first = handler.measure_complexity(project)
+            second = handler.measure_complexity(project)
+
+        assert first == second
+        assert run.call_count == 1
+
+    def test_source_change_invalidates_result(self, project):
+        handler = PythonHandler()
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=_lizard_result()) as run:
+            handler.measure_complexity(project)
+            source = project / "a.py"
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            handler.measure_complexity(project)
+
+        assert run.call_count == 2
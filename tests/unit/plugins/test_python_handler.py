@@ -0,0 +1,209 @@
+"""Tests for PythonHandler."""
+
+import subprocess
+from unittest.mock import patch
+
+from brownfield.models.assessment import ConfidenceLevel
+from brownfield.plugins.python_handler import (
+    DETECTION_SAMPLE_CAP,
+    QUALITY_REQUIREMENTS,
+    TEST_REQUIREMENTS,
+    PythonHandler,
+    _add_missing_requirements,
+    _parse_junit_counts,
+)
+
+
+class TestPythonDetect:
+    """Test PythonHandler.detect."""
+
+    def test_detect_caps_file_count(self, tmp_path):
+        for i in range(DETECTION_SAMPLE_CAP + 5):
+            (tmp_path / f"mod_{i}.py").write_text("x = 1\n", encoding="utf-8")
+
+        result = PythonHandler().detect(tmp_path)
+
+        assert result is not None
+        assert result.confidence == ConfidenceLevel.MEDIUM
+        assert result.evidence["*.py files"] == f"Found {DETECTION_SAMPLE_CAP}+ Python files"
+
+    def test_detect_ignores_vendored_dirs(self, tmp_path):
+        venv = tmp_path / ".venv" / "lib"
+        venv.mkdir(parents=True)
+        for i in range(3):
+            (venv / f"mod_{i}.py").write_text("x = 1\n", encoding="utf-8")
+
+        assert PythonHandler().detect(tmp_path) is None
+
+
+class TestPythonMeasureComplexity:
+    """Test PythonHandler.measure_complexity parsing of lizard CSV output."""
+
+    def test_aggregates_ccn_column(self, tmp_path):
+        csv_output = (
+            '4,2,12,1,4,"f@1-4@a.py","a.py","f","f( x )",1,4\n30,12,90,1,30,"g@6-36@a.py","a.py","g","g( )",6,36\n'
+        )
+        completed = subprocess.CompletedProcess(args=["lizard"], returncode=0, stdout=csv_output, stderr="")
+        PythonHandler.measure_complexity.cache_clear()
+
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=completed):
+            metrics = PythonHandler().measure_complexity(tmp_path)
+
+        assert metrics == {"average": 7.0, "maximum": 12.0, "violations": 1.0}
+
+
+class TestAddMissingRequirements:
+    """Test _add_missing_requirements."""
+
+    def test_appends_only_missing_packages(self, tmp_path):
+        requirements = tmp_path / "requirements-dev.txt"
+        requirements.write_text(
+            "# dev tools\nPyLint==3.1.0\nblack[jupyter]>=24.1\n-r requirements.txt", encoding="utf-8"
+        )
+
+        added = _add_missing_requirements(requirements, QUALITY_REQUIREMENTS)
+
+        assert added == ["pre-commit"]
+        assert requirements.read_text(encoding="utf-8").endswith("requirements.txt\npre-commit>=3.6.0\n")
+
+    def test_no_write_when_all_present(self, tmp_path):
+        requirements = tmp_path / "requirements-dev.txt"
+        requirements.write_text("pytest\npytest_cov\n", encoding="utf-8")
+
+        assert _add_missing_requirements(requirements, TEST_REQUIREMENTS) == []
+        assert requirements.read_text(encoding="utf-8") == "pytest\npytest_cov\n"
+
+
+class TestInstallQualityGatesCache:
+    """Test that linter/formatter results are reused for an unchanged tree."""
+
+    def _install_twice(self, tmp_path, linter_result, formatter_result, ruff_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("x = 1\n", encoding="utf-8")
+        handler = PythonHandler()
+
+        with (
+            patch.object(PythonHandler, "_count_linter_issues", return_value=linter_result) as linter,
+            patch.object(PythonHandler, "_count_unformatted_files", return_value=formatter_result),
+            patch("brownfield.plugins.python_handler.shutil.which", return_value=ruff_path),
+            patch("brownfield.remediation.quality.QualityGatesInstaller.install_pre_commit_hooks", return_value=[]),
+            patch("brownfield.remediation.quality.QualityGatesInstaller.analyze_complexity", return_value={}),
+        ):
+            first = handler.install_quality_gates(tmp_path)
+            second = handler.install_quality_gates(tmp_path)
+
+        return first, second, linter.call_count
+
+    def test_second_run_skips_linter_and_formatter(self, tmp_path):
+        first, second, linter_runs = self._install_twice(tmp_path, ("ruff", 7), ("ruff", 2), "/usr/bin/ruff")
+
+        assert linter_runs == 1
+        assert (second.linter, second.formatter) == ("ruff", "ruff")
+        assert (second.linter_issues_found, second.formatter_files_changed) == (7, 2)
+        assert first == second
+
+    def test_fallback_results_are_cached_under_their_own_labels(self, tmp_path):
+        first, second, linter_runs = self._install_twice(tmp_path, ("pylint", 7), ("ruff", 2), "/usr/bin/ruff")
+
+        assert linter_runs == 1
+        assert (second.linter, second.formatter) == ("pylint", "ruff")
+        assert first == second
+
+
+class TestCountUnformattedFiles:
+    """Test black --check result accounting."""
+
+    def _run(self, tmp_path, returncode, stderr):
+        completed = subprocess.CompletedProcess(args=["black"], returncode=returncode, stdout="", stderr=stderr)
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=completed):
+            return PythonHandler()._count_black_unformatted(tmp_path)
+
+    def test_clean_tree(self, tmp_path):
+        assert self._run(tmp_path, 0, "All done! ✨ 🍰 ✨\n3 files would be left unchanged.\n") == 0
+
+    def test_counts_files_from_stderr(self, tmp_path):
+        stderr = (
+            "would reformat src/a.py\nwould reformat src/b.py\n\n"
+            "Oh no! 💥 💔 💥\n2 files would be reformatted, 1 file would be left unchanged.\n"
+        )
+        assert self._run(tmp_path, 1, stderr) == 2
+
+    def test_internal_error_is_not_counted(self, tmp_path):
+        assert self._run(tmp_path, 123, "error: cannot format src/a.py\n") is None
+
+
+class TestPythonScanSecurity:
+    """Test PythonHandler.scan_security parsing of bandit JSON."""
+
+    def test_counts_severities_from_bytes_output(self, tmp_path):
+        report = b'{"results": [{"issue_severity": "HIGH"}, {"issue_severity": "LOW"}, {"issue_severity": "LOW"}]}'
+        completed = subprocess.CompletedProcess(args=["bandit"], returncode=1, stdout=report, stderr=b"")
+        PythonHandler.scan_security.cache_clear()
+
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=completed) as run:
+            counts = PythonHandler().scan_security(tmp_path)
+
+        assert run.call_args.kwargs["text"] is False
+        assert counts == {"critical": 0, "high": 1, "medium": 0, "low": 2}
+
+    def test_malformed_output_returns_zeros(self, tmp_path):
+        completed = subprocess.CompletedProcess(args=["bandit"], returncode=2, stdout=b"not json", stderr=b"")
+        PythonHandler.scan_security.cache_clear()
+
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=completed):
+            counts = PythonHandler().scan_security(tmp_path)
+
+        assert counts == {"critical": 0, "high": 0, "medium": 0, "low": 0}
+
+
+class TestParseJunitCounts:
+    """Test _parse_junit_counts."""
+
+    def test_counts_from_report(self, tmp_path):
+        report = tmp_path / "report.xml"
+        report.write_text(
+            '<?xml version="1.0" encoding="utf-8"?><testsuites>'
+            '<testsuite name="pytest" errors="1" failures="2" skipped="1" tests="10"></testsuite>'
+            "</testsuites>",
+            encoding="utf-8",
+        )
+
+        assert _parse_junit_counts(report) == (6, 2)
+
+    def test_missing_report(self, tmp_path):
+        assert _parse_junit_counts(tmp_path / "missing.xml") is None
+
+
+class TestRuffQualityChecks:
+    """Test ruff-based linter and formatter accounting."""
+
+    def test_counts_ruff_diagnostics(self, tmp_path):
+        report = b'[{"code": "F401"}, {"code": "E501"}, {"code": "F841"}]'
+        completed = subprocess.CompletedProcess(args=["ruff"], returncode=0, stdout=report, stderr=b"")
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=completed):
+            assert PythonHandler()._count_ruff_issues(tmp_path) == 3
+
+    def test_counts_ruff_format_summary(self, tmp_path):
+        completed = subprocess.CompletedProcess(
+            args=["ruff"], returncode=1, stdout="Would reformat: src/a.py\n2 files would be reformatted\n", stderr=""
+        )
+        with patch("brownfield.plugins.python_handler.ProcessRunner.run", return_value=completed):
+            assert PythonHandler()._count_ruff_unformatted(tmp_path) == 2
+
+    def test_falls_back_to_pylint_without_ruff(self, tmp_path):
+        handler = PythonHandler()
+        with (
+            patch("brownfield.plugins.python_handler.shutil.which", return_value=None),
+            patch.object(PythonHandler, "_count_pylint_issues", return_value=5) as pylint,
+        ):
+            assert handler._count_linter_issues(tmp_path) == ("pylint", 5)
+        pylint.assert_called_once()
+
+    def test_reports_pylint_when_ruff_fails(self, tmp_path):
+        handler = PythonHandler()
+        with (
+            patch("brownfield.plugins.python_handler.shutil.which", return_value="/usr/bin/ruff"),
+            patch.object(PythonHandler, "_count_ruff_issues", return_value=None),
+            patch.object(PythonHandler, "_count_pylint_issues", return_value=5),
+        ):
+            assert handler._count_linter_issues(tmp_path) == ("pylint", 5)
@@ -0,0 +1,25 @@
+"""Tests for the plugin registry."""
+
+import pytest
+
+from brownfield.plugins.registry import (
+    UnsupportedLanguageError,
+    get_handler,
+    list_supported_languages,
+)
+
+
+class TestRegistry:
+    """Test lazy handler discovery."""
+
+    def test_builtin_languages_listed(self):
+        assert {"go", "javascript", "python", "rust"} <= set(list_supported_languages())
+
+    def test_get_handler_returns_shared_instance(self):
+        handler = get_handler("python")
+        assert handler.__class__.__name__ == "PythonHandler"
+        assert get_handler("python") is handler
+
+    def test_unknown_language_raises(self):
+        with pytest.raises(UnsupportedLanguageError):
+            get_handler("cobol")
@@ -0,0 +1,131 @@
+"""Tests for quality gates analysis."""
+
+import io
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from brownfield.remediation import quality
+from brownfield.remediation.quality import QualityGatesInstaller
+
+LIZARD_XML = b"""<?xml version="1.0" ?>
+<cppncss>
+  <measure type="Function">
+    <labels><label>Nr.</label><label>NCSS</label><label>CCN</label></labels>
+    <item name="simple(...) at ./app/core.py:1"><value>1</value><value>3</value><value>2</value></item>
+    <item name="tangled(...) at ./app/core.py:10"><value>2</value><value>40</value><value>15</value></item>
+    <item name="branchy(...) at ./app/util.py:5"><value>3</value><value>30</value><value>12</value></item>
+    <average label="NCSS" value="24"/>
+  </measure>
+  <measure type="File">
+    <item name="./app/core.py"><value>1</value><value>43</value><value>99</value></item>
+  </measure>
+</cppncss>
+"""
+
+
+def test_analyze_complexity_streams_function_items(tmp_path):
+    """Only Function-measure items above threshold are reported, grouped by file."""
+    installer = QualityGatesInstaller(MagicMock(), tmp_path)
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=LIZARD_XML, stderr=b"")
+
+    with (
+        patch("brownfield.remediation.quality.subprocess.run", return_value=completed),
+    ):
+        violations = installer.analyze_complexity(threshold=10)
+
+    assert violations == {
+        "app/core.py": [
+            {"function": "tangled(...)", "complexity": 15, "threshold": 10, "location": "./app/core.py:10"}
+        ],
+        "app/util.py": [{"function": "branchy(...)", "complexity": 12, "threshold": 10, "location": "./app/util.py:5"}],
+    }
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_scan_security_issues_groups_by_severity(tmp_path, streaming):
+    """Bandit's JSON report is grouped by severity, with or without ijson."""
+    if streaming and quality.ijson is None:
+        pytest.skip("ijson not installed")
+
+    installer = QualityGatesInstaller(MagicMock(), tmp_path)
+    report = b"""{"results": [
+        {"filename": "app.py", "line_number": 3, "issue_text": "eval", "issue_confidence": "HIGH",
+         "issue_severity": "HIGH"},
+        {"filename": "app.py", "line_number": 9, "issue_text": "assert", "issue_confidence": "LOW",
+         "issue_severity": "LOW"}
+    ]}"""
+    process = MagicMock(stdout=io.BytesIO(report))
+
+    with (
+        patch.object(quality, "ijson", quality.ijson if streaming else None),
+        patch("brownfield.remediation.quality.subprocess.Popen", return_value=process),
+    ):
+        issues = installer.scan_security_issues()
+
+    assert [issue["line"] for issue in issues["high"]] == [3]
+    assert [issue["line"] for issue in issues["low"]] == [9]
+    assert issues["critical"] == issues["medium"] == []
+    process.wait.assert_called_once()
+
+
+def test_run_all_scans_returns_both_results(tmp_path):
+    """run_all_scans returns complexity and security results together."""
+    installer = QualityGatesInstaller(MagicMock(), tmp_path)
+    complexity = {"app.py": [{"function": "f", "complexity": 12, "threshold": 10, "location": "app.py:1"}]}
+    security = {"critical": [], "high": [], "medium": [], "low": []}
+
+    with (
+        patch.object(installer, "analyze_complexity", return_value=complexity) as analyze,
+        patch.object(installer, "scan_security_issues", return_value=security),
+    ):
+        assert installer.run_all_scans(threshold=12) == (complexity, security)
+
+    analyze.assert_called_once_with(12)
+
+
+def test_create_formatter_config_skips_existing_black_table(tmp_path):
+    """An existing [tool.black] table (in any spelling) is left untouched."""
+    pyproject = tmp_path / "pyproject.toml"
+    original = '[project]\nname = "shop"\n\n[tool]\nblack = { line-length = 88 }\n'
+    pyproject.write_text(original, encoding="utf-8")
+
+    QualityGatesInstaller(MagicMock(), tmp_path).create_formatter_config()
+
+    assert pyproject.read_text(encoding="utf-8") == original
+
+
+def test_analyze_complexity_reuses_results_until_sources_change(tmp_path):
+    """lizard is only re-run after a source file changes."""
+    source = tmp_path / "app" / "core.py"
+    source.parent.mkdir()
+    source.write_text("def tangled():\n    pass\n", encoding="utf-8")
+    installer = QualityGatesInstaller(MagicMock(), tmp_path)
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=LIZARD_XML, stderr=b"")
+
+    with (
+        patch("brownfield.remediation.quality.subprocess.run", return_value=completed) as run,
+    ):
+        first = installer.analyze_complexity(threshold=10)
+        assert installer.analyze_complexity(threshold=10) == first
+        assert run.call_count == 1
+
+        source.write_text("def tangled():\n    return 1\n", encoding="utf-8")
+        installer.analyze_complexity(threshold=10)
+        assert run.call_count == 2
+
+
+def test_install_pre_commit_hooks_warms_hook_environments(tmp_path):
+    """Hook environments are installed eagerly after the git hook."""
+    installer = QualityGatesInstaller(MagicMock(), tmp_path)
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+
+    with patch("brownfield.remediation.quality.subprocess.run", return_value=completed) as run:
+        hooks = installer.install_pre_commit_hooks()
+
+    assert [call.args[0] for call in run.call_args_list] == [
+        ["pre-commit", "install"],
+        ["pre-commit", "install-hooks"],
+    ]
+    assert hooks == [".pre-commit-config.yaml", "pre-commit-framework", "pre-commit-environments"]
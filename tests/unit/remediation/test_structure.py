@@ -0,0 +1,145 @@
+"""Tests for structure plan generation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from brownfield.models.assessment import ConfidenceLevel, LanguageDetection
+from brownfield.remediation import structure
+from brownfield.remediation.structure import StructurePlanGenerator
+
+
+@pytest.fixture
+def python_project(tmp_path):
+    """Create a flat Python project with cross-module imports."""
+    (tmp_path / "utils.py").write_text("def helper():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "models.py").write_text("from utils import helper\n", encoding="utf-8")
+    (tmp_path / "app.py").write_text("import models\nimport utils\n", encoding="utf-8")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "service.py").write_text("from models import x\n", encoding="utf-8")
+    return tmp_path
+
+
+def _generator(project_root, language="python"):
+    detection = LanguageDetection(
+        language=language,
+        confidence=ConfidenceLevel.HIGH,
+        version=None,
+        framework=None,
+        secondary_languages=[],
+        detection_evidence={},
+    )
+    return StructurePlanGenerator(project_root, detection)
+
+
+def _reference_counts(generator):
+    """Analyze and render the plan, returning import references per moved file."""
+    analysis = generator.analyze_structure()
+    generator.generate_markdown_plan(analysis)
+    return {move.source.name: move.import_references for move in analysis.files_to_move}
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_import_reference_counts(python_project, use_automaton):
+    """Each root module counts the other files mentioning it."""
+    automaton = structure.ahocorasick if use_automaton else None
+    if use_automaton and automaton is None:
+        pytest.skip("pyahocorasick not installed")
+
+    with patch.object(structure, "ahocorasick", automaton):
+        references = _reference_counts(_generator(python_project))
+
+    assert references == {"utils.py": 2, "models.py": 2, "app.py": 0}
+
+
+def test_analysis_refreshes_source_caches(python_project):
+    """Repeated analyses see files added since the previous run."""
+    generator = _generator(python_project)
+    _reference_counts(generator)
+
+    (python_project / "cli.py").write_text("import utils\n", encoding="utf-8")
+    references = _reference_counts(generator)
+    assert references["utils.py"] == 3
+    assert references["cli.py"] == 0
+
+
+def test_project_name_read_from_project_table(python_project):
+    """Only [project].name is used, not other keys called name."""
+    (python_project / "pyproject.toml").write_text(
+        '[tool.something]\nname = "wrong"\n\n[project]\nname = "shop"\n', encoding="utf-8"
+    )
+
+    assert _generator(python_project).project_name == "shop"
+
+
+def test_references_found_in_non_utf8_files(python_project):
+    """Files that are not valid UTF-8 are still searched for module names."""
+    (python_project / "legacy.py").write_bytes(b"# caf\xe9\nimport utils\n")
+
+    references = _reference_counts(_generator(python_project))
+    assert references["utils.py"] == 3
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_references_found_in_large_files(python_project, use_automaton):
+    """Large files (e.g. bundled code) are searched in full."""
+    automaton = structure.ahocorasick if use_automaton else None
+    if use_automaton and automaton is None:
+        pytest.skip("pyahocorasick not installed")
+
+    padding = b"#" * (256 * 1024)
+    (python_project / "bundle.py").write_bytes(padding + b"\nimport utils\n")
+
+    with patch.object(structure, "ahocorasick", automaton):
+        references = _reference_counts(_generator(python_project))
+
+    assert references["utils.py"] == 3
+
+
+def test_analysis_defers_reference_counting(python_project):
+    """Sources are only scanned for references when the plan is rendered."""
+    generator = _generator(python_project)
+
+    with patch.object(generator, "_build_reference_index", wraps=generator._build_reference_index) as build:
+        analysis = generator.analyze_structure()
+        assert build.call_count == 0
+        assert all(move.import_references is None for move in analysis.files_to_move)
+
+        generator.generate_markdown_plan(analysis)
+        assert build.call_count == 1
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_overlapping_module_names_all_counted(tmp_path, use_automaton):
+    """A name that is a prefix of another is still found where only the longer one appears."""
+    automaton = structure.ahocorasick if use_automaton else None
+    if use_automaton and automaton is None:
+        pytest.skip("pyahocorasick not installed")
+
+    (tmp_path / "util.py").write_text("", encoding="utf-8")
+    (tmp_path / "utils.py").write_text("", encoding="utf-8")
+    (tmp_path / "app.py").write_text("import utils\n", encoding="utf-8")
+
+    with patch.object(structure, "ahocorasick", automaton):
+        references = _reference_counts(_generator(tmp_path))
+
+    assert references == {"util.py": 1, "utils.py": 1, "app.py": 0}
+
+
+def test_vendored_directories_not_scanned(python_project):
+    """References inside virtualenvs and build output are ignored."""
+    for vendored in (".venv/lib", "node_modules/pkg", "build/lib"):
+        (python_project / vendored).mkdir(parents=True)
+        (python_project / vendored / "copy.py").write_text("import utils\n", encoding="utf-8")
+
+    references = _reference_counts(_generator(python_project))
+
+    assert references["utils.py"] == 2
+
+
+def test_reference_counts_with_small_read_ahead(python_project):
+    """Counting is unchanged when only one file is read ahead of the matcher."""
+    expected = _reference_counts(_generator(python_project))
+
+    with patch.object(structure, "READ_AHEAD", 1):
+        assert _reference_counts(_generator(python_project)) == expected
@@ -0,0 +1,134 @@
+"""Tests for post-refactoring structure verification."""
+
+import pytest
+
+from brownfield.models.assessment import ConfidenceLevel, LanguageDetection
+from brownfield.remediation import structure_verifier
+from brownfield.remediation.structure_verifier import StructureVerifier
+
+
+def _verifier(project_root, language="python"):
+    detection = LanguageDetection(
+        language=language,
+        confidence=ConfidenceLevel.HIGH,
+        version=None,
+        framework=None,
+        secondary_languages=[],
+        detection_evidence={},
+    )
+    return StructureVerifier(project_root, detection)
+
+
+def test_compile_one_reports_errors(tmp_path):
+    """Worker returns the compile error message, or None on success."""
+    good = tmp_path / "good.py"
+    good.write_text("x = 1\n", encoding="utf-8")
+    bad = tmp_path / "bad.py"
+    bad.write_text("def broken(:\n", encoding="utf-8")
+
+    assert structure_verifier._compile_one(str(good)) is None
+    assert "SyntaxError" in structure_verifier._compile_one(str(bad))
+
+
+@pytest.mark.parametrize("file_count", [3, structure_verifier.PARALLEL_COMPILE_MIN_FILES + 8])
+def test_verify_python_imports_serial_and_parallel(tmp_path, file_count):
+    """Both the serial and process-pool paths accept a clean tree."""
+    package = tmp_path / "src" / "app"
+    package.mkdir(parents=True)
+    for i in range(file_count):
+        (package / f"mod{i}.py").write_text(f"VALUE = {i}\n", encoding="utf-8")
+
+    assert _verifier(tmp_path)._verify_python_imports() == (True, [])
+
+
+def test_directory_structure_reports_missing_dirs_then_files(tmp_path):
+    """Missing directories are errors; missing expected files are warnings."""
+    (tmp_path / "src").mkdir()
+
+    passed, issues = _verifier(tmp_path)._verify_directory_structure()
+
+    assert not passed
+    assert [(issue.severity, issue.message) for issue in issues] == [
+        ("error", "Missing required directory: tests/"),
+        ("error", "Missing required directory: docs/"),
+        ("warning", "Missing expected file: src/__init__.py"),
+    ]
+
+
+def test_compile_one_skips_current_bytecode(tmp_path):
+    """Unchanged files with valid bytecode are not recompiled; edited ones are."""
+    module = tmp_path / "mod.py"
+    module.write_text("x = 1\n", encoding="utf-8")
+
+    assert not structure_verifier._bytecode_is_current(str(module))
+    assert structure_verifier._compile_one(str(module)) is None
+    assert structure_verifier._bytecode_is_current(str(module))
+
+    module.write_text("x = 12\n", encoding="utf-8")
+    assert not structure_verifier._bytecode_is_current(str(module))
+
+
+def test_verify_reuses_passing_result_until_sources_change(tmp_path, monkeypatch):
+    """A passing result is served from the cache until a source file changes."""
+    for name in ("src", "tests", "docs"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "src" / "__init__.py").write_text("", encoding="utf-8")
+
+    verifier = _verifier(tmp_path)
+    calls = []
+    monkeypatch.setattr(verifier, "_run_checks", lambda timestamp: calls.append(timestamp) or _passed(timestamp))
+
+    assert verifier.verify().passed
+    assert verifier.verify().passed
+    assert len(calls) == 1
+
+    (tmp_path / "src" / "app.py").write_text("VALUE = 1\n", encoding="utf-8")
+    assert verifier.verify().passed
+    assert len(calls) == 2
+
+
+def _passed(timestamp):
+    return structure_verifier.VerificationResult(
+        passed=True,
+        directory_structure=True,
+        build_integrity=True,
+        import_integrity=True,
+        no_stray_files=True,
+        issues=[],
+        timestamp=timestamp,
+    )
+
+
+def test_javascript_imports_warn_on_unreadable_files_and_skip_bundles(tmp_path, monkeypatch):
+    """Undecodable sources produce a warning; oversized bundles are not read."""
+    monkeypatch.setattr(structure_verifier, "MAX_JS_SCAN_BYTES", 64)
+    (tmp_path / "app.js").write_text("import x from './x';\n", encoding="utf-8")
+    (tmp_path / "broken.js").write_bytes(b"const s = '\xff';\n")
+    (tmp_path / "bundle.js").write_bytes(b"\xff" * 128)
+
+    passed, issues = _verifier(tmp_path, language="javascript")._verify_javascript_imports()
+
+    assert passed
+    assert [issue.message.split(":")[0] for issue in issues] == ["Could not verify imports in broken.js"]
+
+
+def test_checks_share_a_single_source_walk(tmp_path, monkeypatch):
+    """Import and stray file checks reuse one tree walk; only the cache key walks separately."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "script.py").write_text("VALUE = 2\n", encoding="utf-8")
+    (tmp_path / "setup.py").write_text("", encoding="utf-8")
+
+    verifier = _verifier(tmp_path)
+    monkeypatch.setattr(verifier, "_verify_build_integrity", lambda: (True, []))
+    walks = []
+    iter_files = structure_verifier.FileOperations.iter_files
+    monkeypatch.setattr(
+        structure_verifier.FileOperations, "iter_files", lambda *args: walks.append(args) or iter_files(*args)
+    )
+
+    result = verifier.verify()
+
+    assert len(walks) == 2
+    assert not result.no_stray_files
+    assert "Source files still in root directory: script.py" in [issue.message for issue in result.issues]
@@ -0,0 +1,153 @@
+"""Tests for test infrastructure bootstrapping."""
+
+import ast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from brownfield.remediation import testing
+
+
+@pytest.fixture
+def module_project(tmp_path):
+    """Create a project with one src module exposing a class and functions."""
+    module = tmp_path / "src" / "shop" / "orders.py"
+    module.parent.mkdir(parents=True)
+    module.write_text(
+        "class Order:\n"
+        "    def total(self):\n"
+        "        return 0\n"
+        "\n"
+        "def place(order):\n"
+        "    return order\n"
+        "\n"
+        "def _internal():\n"
+        "    pass\n",
+        encoding="utf-8",
+    )
+    return tmp_path, module
+
+
+def test_module_parsed_once_for_smoke_and_contract_tests(module_project):
+    """Smoke and contract generation share one parse of an unchanged module."""
+    project_root, module = module_project
+    bootstrapper = testing.TestingBootstrapper(MagicMock(), project_root)
+    testing._load_ast.cache_clear()
+
+    with patch.object(testing.ast, "parse", wraps=ast.parse) as parse:
+        bootstrapper.generate_smoke_tests([module])
+        bootstrapper.generate_contract_tests([module])
+        assert parse.call_count == 1
+
+        module.write_text(module.read_text(encoding="utf-8") + "\ndef cancel(order):\n    return None\n")
+        bootstrapper.generate_contract_tests([module])
+        assert parse.call_count == 2
+
+    contract = (project_root / "tests" / "contract" / "test_orders_contract.py").read_text(encoding="utf-8")
+    assert "def test_cancel_contract" in contract
+
+
+def test_smoke_test_imports_only_top_level_names(module_project):
+    """Methods and private functions are not imported by smoke tests."""
+    project_root, module = module_project
+
+    content = testing.TestingBootstrapper(MagicMock(), project_root)._generate_smoke_test_content(module)
+
+    assert "from shop.orders import (\n    Order,\n    place,\n)" in content
+    assert "total" not in content
+
+
+def test_core_modules_skip_vendored_directories(tmp_path):
+    """Modules inside build or virtualenv directories are never considered."""
+    for relative in ("src/shop/pricing.py", "src/build/lib/pricing.py", "src/.venv/lib/pricing.py"):
+        module = tmp_path / relative
+        module.parent.mkdir(parents=True)
+        module.write_text("VALUE = 1\n", encoding="utf-8")
+
+    bootstrapper = testing.TestingBootstrapper(MagicMock(), tmp_path)
+    # tmp_path lives under a "pytest-*" directory, which the test-file heuristic would reject
+    with patch.object(bootstrapper, "_is_core_module", return_value=True):
+        core_modules = bootstrapper._identify_core_modules()
+
+    assert core_modules == [tmp_path / "src" / "shop" / "pricing.py"]
+
+
+@pytest.mark.parametrize(
+    ("path", "is_test"),
+    [
+        ("/project/src/app/billing.py", False),
+        ("/project/src/app/contest.py", False),
+        ("/project/src/app/test_billing.py", True),
+        ("/project/src/app/billing_test.py", True),
+        ("/project/src/tests/billing.py", True),
+        ("/project/src/app/Test_Billing.py", True),
+    ],
+)
+def test_test_path_pattern_matches_path_components(path, is_test):
+    """Only test-like path components are excluded, not any substring "test"."""
+    assert bool(testing.TEST_PATH_PATTERN.search(path)) is is_test
+
+
+def test_is_core_module_counts_code_lines(tmp_path):
+    """Modules need more than 50 code lines; comments and blank lines do not count."""
+    bootstrapper = testing.TestingBootstrapper(MagicMock(), tmp_path)
+    tiny = tmp_path / "tiny.py"
+    tiny.write_text("x\n" * 50, encoding="utf-8")
+    dense = tmp_path / "dense.py"
+    dense.write_text("x = 1\n" * 60, encoding="utf-8")
+    sparse = tmp_path / "sparse.py"
+    sparse.write_text("".join(f"# {'-' * 60}\nvalue_{i} = {i}\n" for i in range(40)), encoding="utf-8")
+
+    assert not bootstrapper._is_core_module(tiny)
+    assert bootstrapper._is_core_module(dense)
+    assert not bootstrapper._is_core_module(sparse)
+
+
+def test_is_core_module_ignores_test_directories_above_project(tmp_path):
+    """Only path components inside the project mark a file as a test."""
+    project = tmp_path / "tests" / "checkout"
+    (project / "tests").mkdir(parents=True)
+    bootstrapper = testing.TestingBootstrapper(MagicMock(), project)
+    module = project / "billing.py"
+    module.write_text("x = 1\n" * 60, encoding="utf-8")
+    test_module = project / "tests" / "billing.py"
+    test_module.write_text("x = 1\n" * 60, encoding="utf-8")
+
+    assert bootstrapper._is_core_module(module)
+    assert not bootstrapper._is_core_module(test_module)
+
+
+def test_contract_tests_cover_only_module_level_functions(module_project):
+    """Class methods are not treated as importable public functions."""
+    project_root, module = module_project
+
+    content = testing.TestingBootstrapper(MagicMock(), project_root)._generate_contract_test_content(module)
+
+    assert "from shop.orders import (\n    place,\n)" in content
+    assert "total" not in content
+
+
+def test_calculate_import_path_handles_src_and_flat_layouts(tmp_path):
+    """Modules under src/ drop the src prefix; others are relative to the root."""
+    bootstrapper = testing.TestingBootstrapper(MagicMock(), tmp_path)
+
+    assert bootstrapper._calculate_import_path(tmp_path / "src" / "shop" / "orders.py") == "shop.orders"
+    assert bootstrapper._calculate_import_path(tmp_path / "shop" / "orders.py") == "shop.orders"
+    assert bootstrapper._calculate_import_path(tmp_path / "srcutils.py") == "srcutils"
+
+
+def test_generated_test_files_are_written_once_per_destination(tmp_path):
+    """Modules sharing a stem map to one smoke test file holding the last module's tests."""
+    first = tmp_path / "src" / "a" / "utils.py"
+    second = tmp_path / "src" / "b" / "utils.py"
+    for module, name in ((first, "first"), (second, "second")):
+        module.parent.mkdir(parents=True)
+        module.write_text(f"def {name}():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "src" / "b" / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+
+    bootstrapper = testing.TestingBootstrapper(MagicMock(), tmp_path)
+    created = bootstrapper.generate_smoke_tests([first, second, tmp_path / "src" / "b" / "broken.py"])
+
+    assert created == [tmp_path / "tests" / "test_utils.py"]
+    content = created[0].read_text(encoding="utf-8")
+    assert "from b.utils import (\n    second,\n)" in content
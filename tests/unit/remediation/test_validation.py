@@ -0,0 +1,142 @@
+"""Tests for readiness gate validation."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from brownfield.config import BrownfieldConfig
+from brownfield.remediation import validation
+from brownfield.remediation.validation import CACHE_RETENTION_SECONDS, ValidationRunner
+
+GATE_NAMES = [
+    "Test Coverage",
+    "Cyclomatic Complexity",
+    "Directory Structure",
+    "Build Status",
+    "API Documentation",
+    "Security",
+    "Git Hygiene",
+]
+
+
+@pytest.fixture
+def handler():
+    """Handler reporting a clean project."""
+    handler = MagicMock()
+    handler.measure_complexity.return_value = {"maximum": 4.0}
+    handler.verify_build.return_value = True
+    handler.scan_security.return_value = {"critical": 0, "low": 1}
+    handler.get_standard_structure.return_value = {}
+    return handler
+
+
+@pytest.mark.parametrize("max_workers", [1, 7])
+def test_gates_returned_in_order(tmp_path, handler, max_workers):
+    """Gate order is stable regardless of how many run concurrently."""
+    gates = ValidationRunner(tmp_path, handler, max_workers=max_workers).validate_all_gates()
+
+    assert [gate.name for gate in gates] == GATE_NAMES
+    assert [gate.passed for gate in gates] == [False, True, True, True, True, True, True]
+
+
+def test_slow_gates_overlap(tmp_path, handler):
+    """Build and security checks wait on each other only when run concurrently."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def verify_build(_project_root):
+        barrier.wait()
+        return True
+
+    def scan_security(_project_root):
+        barrier.wait()
+        return {"critical": 0}
+
+    handler.verify_build.side_effect = verify_build
+    handler.scan_security.side_effect = scan_security
+
+    gates = ValidationRunner(tmp_path, handler).validate_all_gates()
+
+    assert gates[3].passed
+    assert gates[5].passed
+
+
+def test_tool_results_reused_until_sources_change(tmp_path, handler):
+    """Handler checks are served from the disk cache for an unchanged tree."""
+    (tmp_path / "app.py").write_text("VALUE = 1\n", encoding="utf-8")
+
+    ValidationRunner(tmp_path, handler).validate_all_gates()
+    ValidationRunner(tmp_path, handler).validate_all_gates()
+    assert handler.measure_complexity.call_count == 1
+    assert handler.verify_build.call_count == 1
+    assert handler.scan_security.call_count == 1
+
+    (tmp_path / "app.py").write_text("VALUE = 2\n", encoding="utf-8")
+    ValidationRunner(tmp_path, handler).validate_all_gates()
+    ValidationRunner(tmp_path, handler, use_cache=False).validate_all_gates()
+    assert handler.scan_security.call_count == 3
+
+
+def test_tool_unavailable_defaults_not_cached(tmp_path, handler):
+    """Zero and False results, which handlers also return without their tools, are rerun."""
+    handler.measure_complexity.return_value = {"average": 0.0, "maximum": 0.0, "violations": 0.0}
+    handler.verify_build.return_value = False
+    handler.scan_security.return_value = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+
+    ValidationRunner(tmp_path, handler).validate_all_gates()
+    ValidationRunner(tmp_path, handler).validate_all_gates()
+
+    assert handler.measure_complexity.call_count == 2
+    assert handler.verify_build.call_count == 2
+    assert handler.scan_security.call_count == 2
+
+
+def test_source_tree_walked_once_per_run(tmp_path, handler):
+    """All cached gates share one source fingerprint."""
+    with patch(
+        "brownfield.remediation.validation.source_tree_fingerprint", wraps=validation.source_tree_fingerprint
+    ) as fingerprint:
+        ValidationRunner(tmp_path, handler).validate_all_gates()
+
+    fingerprint.assert_called_once()
+
+
+def test_validation_sweeps_stale_cache_entries(tmp_path, handler):
+    """A validation run deletes shared cache files older than the retention period."""
+    cache_dir = BrownfieldConfig.get_state_dir(tmp_path) / "cache"
+    cache_dir.mkdir(parents=True)
+    stale = cache_dir / "stale.json"
+    stale.write_text("{}", encoding="utf-8")
+    old = time.time() - CACHE_RETENTION_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    ValidationRunner(tmp_path, handler).validate_all_gates()
+
+    assert not stale.exists()
+    assert any(cache_dir.glob("*.json"))
+
+
+def test_directory_structure_ratio_counts_only_directories(tmp_path, handler):
+    """Standard names present as plain files do not count toward the structure gate."""
+    handler.get_standard_structure.return_value = {"src": [], "tests": [], "docs": []}
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests").write_text("", encoding="utf-8")
+
+    gate = ValidationRunner(tmp_path, handler)._validate_directory_structure()
+
+    assert gate.current_value == pytest.approx(1 / 3)
+    assert not gate.passed
+
+
+def test_gates_do_not_share_template_state(tmp_path, handler):
+    """Mutating a returned gate leaves templates and later runs untouched."""
+    first = ValidationRunner(tmp_path, handler, use_cache=False).validate_all_gates()
+    first[0].exception_conditions.append("Custom exception")
+    first[0].passed = True
+
+    second = ValidationRunner(tmp_path, handler, use_cache=False).validate_all_gates()
+
+    assert second[0].exception_conditions == ["Project is pure library with no business logic"]
+    assert not second[0].passed
@@ -0,0 +1,51 @@
+"""Tests for checkpoint persistence."""
+
+from datetime import datetime
+
+import pytest
+
+from brownfield.models.checkpoint import PhaseCheckpoint, Task
+from brownfield.models.state import Phase
+from brownfield.state.checkpoint_store import CheckpointStore
+
+
+@pytest.fixture
+def checkpoint():
+    """Checkpoint with one completed and one pending task."""
+    return PhaseCheckpoint(
+        phase=Phase.TESTING,
+        completed_tasks=[Task("install_pytest", "Install pytest", Phase.TESTING, 5, completed=True)],
+        pending_tasks=[Task("generate_tests", "Generate tests", Phase.TESTING, 20)],
+        timestamp=datetime(2024, 5, 1, 12, 30),  # noqa: DTZ001 - checkpoints use naive UTC timestamps
+        interrupted=True,
+        context={"coverage": 0.42},
+    )
+
+
+def test_save_and_load_round_trip(tmp_path, checkpoint):
+    """A saved checkpoint loads back with the same tasks and metadata."""
+    store = CheckpointStore(tmp_path / "memory" / "checkpoint.json")
+
+    store.save(checkpoint)
+    loaded = store.load()
+
+    assert store.exists()
+    assert loaded == checkpoint
+    assert list(store.checkpoint_path.parent.glob("*.tmp")) == []
+
+
+def test_failed_save_keeps_previous_checkpoint(tmp_path, checkpoint, monkeypatch):
+    """A write that fails midway leaves the earlier checkpoint intact."""
+    store = CheckpointStore(tmp_path / "checkpoint.json")
+    store.save(checkpoint)
+
+    def fail_dumps(*args, **kwargs):
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr("brownfield.state.checkpoint_store.fast_json.dumps", fail_dumps)
+    checkpoint.interrupted = False
+    with pytest.raises(TypeError, match="not serializable"):
+        store.save(checkpoint)
+
+    assert store.load().interrupted is True
+    assert list(tmp_path.glob("*.tmp")) == []
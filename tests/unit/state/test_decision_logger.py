@@ -0,0 +1,37 @@
+"""Tests for decision log persistence."""
+
+from unittest.mock import MagicMock
+
+from brownfield.state.decision_logger import DecisionLogger
+
+
+def _decision(text):
+    decision = MagicMock()
+    decision.to_markdown.return_value = text
+    return decision
+
+
+def test_each_decision_is_on_disk_once_logged(tmp_path):
+    """Entries are readable immediately, in order, without closing the logger."""
+    log_path = tmp_path / "memory" / "decisions.md"
+    logger = DecisionLogger(log_path)
+
+    logger.log_decision(_decision("## First"))
+    assert log_path.read_text(encoding="utf-8") == "## First\n---\n\n"
+
+    DecisionLogger(log_path).log_decision(_decision("## Other"))
+    logger.log_decision(_decision("## Second"))
+    assert log_path.read_text(encoding="utf-8") == "## First\n---\n\n## Other\n---\n\n## Second\n---\n\n"
+
+
+def test_logger_recreates_directory_removed_after_first_use(tmp_path):
+    """A log directory deleted between decisions is created again."""
+    log_path = tmp_path / "memory" / "decisions.md"
+    logger = DecisionLogger(log_path)
+    logger.log_decision(_decision("## First"))
+    log_path.unlink()
+    log_path.parent.rmdir()
+
+    logger.log_decision(_decision("## Second"))
+
+    assert log_path.read_text(encoding="utf-8") == "## Second\n---\n\n"
@@ -0,0 +1,153 @@
+"""Tests for cache utilities."""
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from brownfield.utils.cache import Cache, DiskCache, cache_result, memoize_file_hash
+
+
+def test_memoize_file_hash_matches_sha256(tmp_path):
+    """The memoized hash is the SHA-256 of the file content."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 100_000)
+
+    assert memoize_file_hash(path) == hashlib.sha256(b"x" * 100_000).hexdigest()
+
+
+def test_disk_cache_round_trip_and_invalidate(tmp_path):
+    """Values survive a new DiskCache instance and can be invalidated by key."""
+    DiskCache(tmp_path).set("metrics:/project:abc", {"complexity": 4.5})
+
+    cache = DiskCache(tmp_path)
+    assert cache.get("metrics:/project:abc") == {"complexity": 4.5}
+    assert len(cache._get_cache_path("metrics:/project:abc").stem) == 32
+
+    cache.invalidate("metrics:/project:abc")
+    assert cache.get("metrics:/project:abc") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Reading an entry protects it from eviction when the cache is full."""
+    cache = Cache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_memory_cache_sweeps_expired_entries(monkeypatch):
+    """Expired entries are dropped periodically even if never read again."""
+    cache = Cache(ttl_seconds=10)
+    now = [1000.0]
+    monkeypatch.setattr("brownfield.utils.cache.time.time", lambda: now[0])
+    cache.set("stale", 1)
+
+    now[0] += 60
+    for i in range(Cache.SWEEP_INTERVAL):
+        cache.set(f"fresh-{i}", i)
+
+    assert "stale" not in cache._cache
+    assert len(cache._cache) == Cache.SWEEP_INTERVAL
+
+
+def test_memory_cache_is_safe_across_threads():
+    """Concurrent readers and writers never see entries vanish mid-operation."""
+    cache = Cache(ttl_seconds=0, maxsize=8)
+    # Switch threads as often as possible so unguarded check-then-act sequences interleave
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def churn(worker):
+        for i in range(2000):
+            key = f"{worker}-{i % 16}"
+            cache.set(key, i)
+            cache.get(key)
+            cache.get(f"{(worker + 1) % 8}-{i % 16}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(churn, range(8)))
+    finally:
+        sys.setswitchinterval(previous_interval)
+
+    assert len(cache._cache) <= 8
+
+
+def test_cache_result_default_key_separates_colliding_arguments():
+    """Arguments that joined to the same string under the old key no longer share results."""
+    calls = []
+
+    @cache_result()
+    def combine(*parts, **options):
+        calls.append(parts)
+        return len(calls)
+
+    combine.cache_clear()
+    assert combine("a:b", "c") == 1
+    assert combine("a", "b:c") == 2
+    assert combine("a:b", "c") == 1
+    assert combine(lambda: None) == 3
+
+
+def test_disk_cache_expires_and_removes_old_entries(tmp_path):
+    """Entries older than max_age are deleted on read; corrupt entries are discarded."""
+    cache = DiskCache(tmp_path)
+    cache.set("old", 1)
+    path = cache._get_cache_path("old")
+    os.utime(path, (0, 0))
+
+    assert cache.get("old") == 1
+    assert cache.get("old", max_age_seconds=60) is None
+    assert not path.exists()
+
+    cache._get_cache_path("corrupt").write_bytes(b"{not json")
+    assert cache.get("corrupt") is None
+    assert not cache._get_cache_path("corrupt").exists()
+
+
+def test_disk_cache_sweep_and_clear(tmp_path):
+    """sweep_expired removes only old entries; clear removes the rest but not other files."""
+    cache = DiskCache(tmp_path)
+    cache.set("old", 1)
+    cache.set("new", 2)
+    os.utime(cache._get_cache_path("old"), (0, 0))
+    (tmp_path / "README").write_text("keep", encoding="utf-8")
+
+    cache.sweep_expired(max_age_seconds=3600)
+    assert (cache.get("old"), cache.get("new")) == (None, 2)
+
+    cache.clear()
+    assert cache.get("new") is None
+    assert [path.name for path in tmp_path.iterdir()] == ["README"]
+
+
+def test_disk_cache_stores_dates_paths_and_uuids_as_strings(tmp_path):
+    """Timestamps, paths and UUIDs nested in cached values come back as strings."""
+    uuid = UUID("12345678-1234-5678-1234-567812345678")
+    DiskCache(tmp_path).set(
+        "scan",
+        {"at": datetime(2024, 3, 1, 12, 30, tzinfo=UTC), "files": (Path("src/app.py"),), "run": [uuid]},
+    )
+
+    assert DiskCache(tmp_path).get("scan") == {
+        "at": "2024-03-01T12:30:00+00:00",
+        "files": ["src/app.py"],
+        "run": [str(uuid)],
+    }
+
+
+def test_disk_cache_rejects_unsupported_values(tmp_path):
+    """Values that are not JSON-serializable fail loudly instead of being stringified."""
+    with pytest.raises(TypeError):
+        DiskCache(tmp_path).set("scan", {"issues": {1, 2}})
@@ -0,0 +1,31 @@
+"""Tests for reading coverage.py JSON totals."""
+
+import pytest
+
+from brownfield.utils import coverage_report
+
+
+@pytest.fixture(params=["ijson", "fast_json"])
+def parser(request, monkeypatch):
+    """Run each test with the streaming parser (when installed) and the full parse."""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(coverage_report, "ijson", None)
+    return request.param
+
+
+def test_reads_totals_after_per_file_data(tmp_path, parser):
+    """The totals percentage is found regardless of the per-file entries before it."""
+    report = tmp_path / "coverage.json"
+    report.write_text('{"files": {"a.py": {"summary": {"percent_covered": 10}}}, "totals": {"percent_covered": 72.5}}')
+
+    assert coverage_report.read_total_coverage(report) == 72.5
+
+
+def test_missing_totals_reads_as_zero(tmp_path, parser):
+    """Reports without totals count as no coverage."""
+    report = tmp_path / "coverage.json"
+    report.write_text('{"files": {}}')
+
+    assert coverage_report.read_total_coverage(report) == 0.0
@@ -0,0 +1,25 @@
+"""Tests for CLI error handling utilities."""
+
+import pytest
+
+from brownfield.utils.error_handler import handle_errors
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+@pytest.mark.parametrize(
+    ("debug", "expected"),
+    [("true", "Traceback"), ("", "Set BROWNFIELD_DEBUG=true")],
+)
+def test_unexpected_error_output_follows_debug_mode(monkeypatch, capsys, debug, expected):
+    """The traceback is shown only for commands decorated in debug mode."""
+    monkeypatch.setenv("BROWNFIELD_DEBUG", debug)
+    command = handle_errors(fail)
+
+    with pytest.raises(SystemExit) as exc_info:
+        command()
+
+    assert exc_info.value.code == 1
+    assert expected in capsys.readouterr().out
@@ -0,0 +1,47 @@
+"""Tests for the JSON helpers with and without orjson."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from brownfield.utils import fast_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the standard library."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+def test_dumps_matches_stdlib_conversions(backend):
+    """Datetimes use the default hook and non-string keys become strings, as with json.dumps."""
+    value = {"when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC), 1: ["a", 2.5, None]}
+
+    encoded = fast_json.dumps(value, indent=True, default=str)
+
+    assert json.loads(encoded) == {"when": "2024-01-02 03:04:05+00:00", "1": ["a", 2.5, None]}
+    assert encoded.startswith(b'{\n  "')
+
+
+def test_loads_round_trips_and_rejects_malformed_input(backend):
+    """Parsed output round-trips, and bad input raises JSONDecodeError."""
+    assert fast_json.loads(fast_json.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+    with pytest.raises(fast_json.JSONDecodeError):
+        fast_json.loads(b"{not json")
+
+
+def test_load_file_small_and_memory_mapped(tmp_path, backend, monkeypatch):
+    """Files on both sides of the mmap threshold parse to the same value."""
+    monkeypatch.setattr(fast_json, "MMAP_THRESHOLD_BYTES", 16)
+    small = tmp_path / "small.json"
+    small.write_bytes(b'{"a": 1}')
+    large = tmp_path / "large.json"
+    large.write_bytes(fast_json.dumps({"events": list(range(100))}))
+
+    assert fast_json.load_file(small) == {"a": 1}
+    assert fast_json.load_file(large) == {"events": list(range(100))}
@@ -0,0 +1,57 @@
+"""Tests for file operation helpers."""
+
+import errno
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from brownfield.utils.file_operations import FileOperations
+
+
+def test_ensure_dir_creates_once_and_rechecks_on_request(tmp_path):
+    """Later calls for the same directory skip mkdir unless a recheck is requested."""
+    target = tmp_path / "reports" / "nested"
+
+    FileOperations.ensure_dir(target)
+    assert target.is_dir()
+
+    with patch.object(type(target), "mkdir") as mkdir:
+        FileOperations.ensure_dir(target)
+        mkdir.assert_not_called()
+
+    shutil.rmtree(tmp_path / "reports")
+    FileOperations.ensure_dir(target, recheck=True)
+    assert target.is_dir()
+
+
+def test_atomic_write_bytes_keeps_old_content_on_failure(tmp_path):
+    """A failed replace leaves the previous file and no temp files behind."""
+    target = tmp_path / "state.json"
+    FileOperations.atomic_write_bytes(target, b"old")
+
+    with (
+        patch("brownfield.utils.file_operations.os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        FileOperations.atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_safe_move_renames_and_falls_back_across_filesystems(tmp_path):
+    """Moves use os.replace, switching to shutil.move only for cross-device errors."""
+    src = tmp_path / "a.txt"
+    src.write_text("data")
+    dst = tmp_path / "out" / "a.txt"
+
+    FileOperations.safe_move(src, dst)
+    assert dst.read_text() == "data"
+    assert not src.exists()
+
+    cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+    with patch("brownfield.utils.file_operations.os.replace", side_effect=cross_device):
+        FileOperations.safe_move(dst, src)
+    assert src.read_text() == "data"
+    assert not dst.exists()
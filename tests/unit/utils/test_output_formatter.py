@@ -0,0 +1,13 @@
+"""Tests for OutputFormatter."""
+
+from brownfield.utils.output_formatter import OutputFormatter
+
+
+def test_messages_are_printed_verbatim(capsys):
+    """Square brackets in messages are kept rather than parsed as markup."""
+    formatter = OutputFormatter()
+
+    formatter.success("Moved [tool.ruff] settings")
+    formatter.warning("2 files left")
+
+    assert capsys.readouterr().out == "✓ Moved [tool.ruff] settings\n⚠ 2 files left\n"
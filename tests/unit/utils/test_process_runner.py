@@ -0,0 +1,91 @@
+"""Tests for ProcessRunner."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from brownfield.utils.process_runner import ProcessRunner, _find_devenv_root_cached
+
+
+@pytest.fixture
+def fresh_devenv_cache():
+    """Isolate tests from devenv lookups cached by earlier tests."""
+    _find_devenv_root_cached.cache_clear()
+    yield
+    _find_devenv_root_cached.cache_clear()
+
+
+class TestIdleTimeout:
+    """Test ProcessRunner.run with idle_timeout."""
+
+    def test_streaming_process_completes(self, tmp_path):
+        script = "import sys; print('out'); print('err', file=sys.stderr)"
+        result = ProcessRunner.run([sys.executable, "-c", script], cwd=str(tmp_path), idle_timeout=5)
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "out"
+        assert result.stderr.strip() == "err"
+
+    def test_bytes_output_when_text_disabled(self, tmp_path):
+        result = ProcessRunner.run(
+            [sys.executable, "-c", "print('out')"], cwd=str(tmp_path), idle_timeout=5, text=False
+        )
+
+        assert result.stdout.strip() == b"out"
+
+    def test_silent_process_is_stopped(self, tmp_path):
+        script = "import time; print('started', flush=True); time.sleep(30)"
+        started = time.monotonic()
+
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            ProcessRunner.run([sys.executable, "-c", script], cwd=str(tmp_path), idle_timeout=0.5)
+
+        assert time.monotonic() - started < 10
+        assert "started" in exc_info.value.output
+
+    def test_stalled_grandchild_is_stopped(self, tmp_path):
+        """A child that forks a process holding the output pipes is stopped with it."""
+        grandchild = "import time; time.sleep(30)"
+        script = (
+            "import subprocess, sys, time; "
+            f"subprocess.Popen([sys.executable, '-c', {grandchild!r}]); "
+            "print('started', flush=True); time.sleep(30)"
+        )
+        started = time.monotonic()
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            ProcessRunner.run([sys.executable, "-c", script], cwd=str(tmp_path), idle_timeout=0.5)
+
+        assert time.monotonic() - started < 10
+
+
+@pytest.mark.usefixtures("fresh_devenv_cache")
+class TestFindDevenvRoot:
+    """Test ProcessRunner._find_devenv_root."""
+
+    def test_finds_nearest_nix_file_in_parents(self, tmp_path):
+        (tmp_path / "flake.nix").touch()
+        nested = tmp_path / "pkg" / "src"
+        nested.mkdir(parents=True)
+
+        assert ProcessRunner._find_devenv_root(nested) == (tmp_path.resolve(), "flake")
+
+        (tmp_path / "pkg" / "devenv.nix").touch()
+        _find_devenv_root_cached.cache_clear()
+        assert ProcessRunner._find_devenv_root(nested) == ((tmp_path / "pkg").resolve(), "devenv")
+
+    def test_result_is_cached_per_directory(self, tmp_path):
+        (tmp_path / "devenv.nix").touch()
+        assert ProcessRunner._find_devenv_root(tmp_path) == (tmp_path.resolve(), "devenv")
+
+        (tmp_path / "devenv.nix").unlink()
+        assert ProcessRunner._find_devenv_root(tmp_path) == (tmp_path.resolve(), "devenv")
+        assert _find_devenv_root_cached.cache_info().hits == 1
+
+    def test_ignores_directories_named_like_nix_files(self, tmp_path):
+        (tmp_path / "devenv.nix").mkdir()
+        (tmp_path / "flake.nix").touch()
+
+        assert ProcessRunner._find_devenv_root(tmp_path) == (tmp_path.resolve(), "flake")
@@ -0,0 +1,63 @@
+"""Tests for performance profiling utilities."""
+
+import pytest
+
+from brownfield.utils import profiler
+
+
+@pytest.fixture
+def debug_mode(monkeypatch):
+    """Enable BROWNFIELD_DEBUG for the profiler, restoring the cached flag afterwards."""
+    monkeypatch.setenv("BROWNFIELD_DEBUG", "true")
+    profiler._refresh_debug()
+    profiler.clear_performance_data()
+    yield
+    monkeypatch.delenv("BROWNFIELD_DEBUG")
+    profiler._refresh_debug()
+    profiler.clear_performance_data()
+
+
+@pytest.mark.usefixtures("debug_mode")
+def test_timed_records_when_debug_enabled():
+    """Timings are collected once debug mode is picked up."""
+
+    @profiler.timed("work")
+    def work():
+        return 42
+
+    assert work() == 42
+    assert profiler.get_performance_stats()["work"]["count"] == 1
+
+
+def test_measure_time_skips_recording_without_debug(monkeypatch):
+    """Without debug mode nothing is recorded."""
+    monkeypatch.delenv("BROWNFIELD_DEBUG", raising=False)
+    profiler._refresh_debug()
+
+    with profiler.measure_time("quiet"):
+        pass
+
+    assert "quiet" not in profiler.get_performance_stats()
+
+
+def test_timed_leaves_function_unwrapped_without_debug(monkeypatch):
+    """Outside debug mode the decorator adds no wrapper at all."""
+    monkeypatch.delenv("BROWNFIELD_DEBUG", raising=False)
+    profiler._refresh_debug()
+
+    def work():
+        return 42
+
+    assert profiler.timed()(work) is work
+
+
+def test_tracker_aggregates_timings():
+    """Statistics are kept as running aggregates per operation."""
+    tracker = profiler.PerformanceTracker()
+    tracker.enabled = True
+
+    for duration in (0.5, 0.25, 1.0):
+        tracker.record("scan", duration)
+
+    assert tracker.get_stats("scan") == {"min": 0.25, "max": 1.0, "total": 1.75, "count": 3, "avg": 1.75 / 3}
+    assert tracker.get_stats("missing")["count"] == 0